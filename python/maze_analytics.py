@@ -0,0 +1,231 @@
+"""
+Maze analytics: how hard is a maze?
+
+Measures the shape of a perfect maze with whole-array NumPy operations, so a maze of
+millions of cells takes seconds:
+
+    python maze_analytics.py mazes.amzt big.amz chunked.npy --output stats.jsonl
+
+analyze() reports per maze:
+    dead_ends        cells with one open side
+    corridors        cells with two open sides
+    junctions        cells with three open sides
+    crossroads       cells with four open sides
+    corridor_lengths histogram of corridor lengths: element i counts the corridors of i
+                     moves, where a corridor runs between two cells that are not
+                     corridor cells (dead ends and junctions)
+    solution_length  moves from the entrance cell to the exit cell
+    diameter         moves along the longest path in the maze
+    diameter_ends    (x, y) grid positions of the two ends of that path
+
+Open sides are counted with a 4-neighbour stencil over the grid: the passage squares
+around every cell are added up as four shifted slices, so only the borders' entrance and
+exit are left out. The diameter takes two breadth-first floods: the cell farthest from
+the entrance is one end of a longest path, and the cell farthest from it is the other.
+The corridors are measured on the second flood's tree by pointer jumping up the parent
+links, so they take a logarithmic number of passes in the longest corridor.
+
+The floods go one level per NumPy pass, so mazes with very long paths (depth-first
+search) take longer than ones with short, bushy trees.
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from maze_core import entrance_and_exit, cell_moves, flood_levels, nearest_cell
+from maze_io import grid_from_tree_bits, load_maze, open_archive
+
+
+def cell_degrees(grid):
+    """
+    Number of open sides of every cell, not counting the entrance and exit.
+
+    Args:
+        grid (numpy.ndarray): Maze grid; anything but a wall (1) is open, so solver marks
+            are fine
+
+    Returns:
+        numpy.ndarray: (height, width) uint8 array.
+    """
+    height, width = grid.shape[0] // 2, grid.shape[1] // 2
+    south = grid[2:-1:2, 1::2] != 1
+    east = grid[1::2, 2:-1:2] != 1
+    degrees = np.zeros((height, width), dtype=np.uint8)
+    degrees[:-1] += south
+    degrees[1:] += south
+    degrees[:, :-1] += east
+    degrees[:, 1:] += east
+    return degrees
+
+
+def _flood(moves, width, start, goal=-1):
+    """
+    Flood the whole maze breadth-first from `start`.
+
+    Returns:
+        tuple: (came_from, farthest, depth, goal_depth): the flood's direction codes, one of
+        the cells farthest from the start, its distance in moves and the distance of
+        `goal` (None when it is not reached).
+    """
+    came_from = np.full(moves.size, -1, dtype=np.int8)
+    farthest, depth = start, 0
+    goal_depth = 0 if goal == start else None
+    for level, cells in enumerate(flood_levels(moves, width, came_from, start), 1):
+        if not len(cells):
+            break
+        farthest, depth = int(cells[0]), level
+        if goal_depth is None and came_from[goal] >= 0:
+            goal_depth = level
+    return came_from, farthest, depth, goal_depth
+
+
+def corridor_lengths(degrees, came_from, width):
+    """
+    Histogram of corridor lengths, measured on the tree of a flood from a dead end.
+
+    Every corridor then runs straight up the tree from a dead end or junction to the
+    nearest such cell above it. The distance from each cell to that cell is found by
+    pointer jumping: every pass adds the distance already known at the cell a link points
+    to and moves the link past it, so the number of passes is logarithmic in the longest
+    corridor. Only links that have not yet reached the end of their corridor take part.
+
+    Args:
+        degrees (numpy.ndarray): cell_degrees() of the maze
+        came_from (numpy.ndarray): Direction codes of a flood rooted at a dead end, as
+            filled in by flood_levels()
+        width (int): Width of the maze in cells
+
+    Returns:
+        numpy.ndarray: Counts indexed by corridor length in moves.
+    """
+    cells = degrees.size
+    index_type = np.int32 if cells < 2 ** 31 - 1 else np.int64
+    steps = np.array((width, -width, 1, -1, 0), dtype=index_type)
+    # The root (4) and unreached cells (-1) pick up the trailing 0 step and point to themselves
+    parent = np.arange(cells, dtype=index_type) - steps[came_from]
+
+    # `end` stands for "the dead end or junction above"; its distance stays 0
+    end = cells
+    node = np.append(degrees.ravel() != 2, True)
+    link = np.where(node[parent] | (came_from < 0), end, parent).astype(index_type)
+    link = np.append(link, index_type(end))
+    distance = np.ones(cells + 1, dtype=index_type)
+    distance[end] = 0
+
+    active = np.flatnonzero(link != end).astype(index_type)
+    while len(active):
+        target = link[active]
+        distance[active] += distance[target]
+        link[active] = link[target]
+        active = active[link[active] != end]
+
+    counted = node[:-1] & (came_from != 4) & (came_from >= 0)
+    return np.bincount(distance[:-1][counted])
+
+
+def analyze(grid, entrance=None, exit=None):
+    """
+    Measure a perfect maze (see the module docstring for the fields).
+
+    Args:
+        grid (numpy.ndarray): Maze grid; only walls (1) are read, so solver marks are fine
+        entrance (tuple): (x, y) grid position of the entrance; defaults to where
+            add_maze_entrance_and_exit() puts it
+        exit (tuple): (x, y) grid position of the exit; defaults likewise
+
+    Returns:
+        dict: JSON-ready statistics.
+    """
+    height, width = grid.shape[0] // 2, grid.shape[1] // 2
+    if entrance is None or exit is None:
+        entrance, exit = entrance_and_exit(grid)
+    degrees = cell_degrees(grid)
+    counts = np.bincount(degrees.ravel(), minlength=5)
+    # cell_moves() only walks 0 and 3, so hand it the walls alone
+    moves = cell_moves((grid == 1).view(np.uint8))
+
+    start = nearest_cell(*entrance, width, height)
+    goal = nearest_cell(*exit, width, height)
+    _, first_end, _, solution_length = _flood(moves, width, start, goal)
+    came_from, second_end, diameter, _ = _flood(moves, width, first_end)
+    histogram = corridor_lengths(degrees, came_from, width)
+
+    def to_grid(cell):
+        return 2 * (cell % width) + 1, 2 * (cell // width) + 1
+
+    return {
+        'width': width,
+        'height': height,
+        'dead_ends': int(counts[1]),
+        'corridors': int(counts[2]),
+        'junctions': int(counts[3]),
+        'crossroads': int(counts[4]),
+        'corridor_lengths': histogram.tolist(),
+        'solution_length': solution_length,
+        'diameter': diameter,
+        'diameter_ends': [to_grid(first_end), to_grid(second_end)],
+    }
+
+
+def _analyze_task(args):
+    """Worker: analyze one .amz or .npy file, or a slice of the records of a .amzt archive."""
+    path, start, stop = args
+    if path.endswith('.amzt'):
+        width, height, records = open_archive(path)
+        return [dict(analyze(grid_from_tree_bits(records[i], width, height)), file=path, index=i)
+                for i in range(start, stop)]
+    if path.endswith('.npy'):
+        return [dict(analyze(np.load(path, mmap_mode='r')), file=path)]
+    maze = load_maze(path)
+    return [dict(analyze(maze.grid, maze.entrance, maze.exit), file=path)]
+
+
+def analyze_files(paths, workers=None, chunk_size=64):
+    """
+    Run analyze() over stored mazes across a process pool.
+
+    Accepts .amz files, .npy grids (e.g. from maze_chunked) and .amzt archives; archives
+    are split into tasks of `chunk_size` mazes.
+
+    Yields:
+        dict: One analyze() result per maze, in input order, with the file name added (and
+        the maze's index for archives).
+    """
+    tasks = []
+    for path in paths:
+        if path.endswith('.amzt'):
+            count = len(open_archive(path)[2])
+            tasks += [(path, i, min(i + chunk_size, count)) for i in range(0, count, chunk_size)]
+        else:
+            tasks.append((path, None, None))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for results in pool.map(_analyze_task, tasks):
+            yield from results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure stored mazes.")
+    parser.add_argument('paths', nargs='+', help=".amz, .npy or .amzt files")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument('--chunk-size', type=int, default=64, help="archive mazes per task")
+    parser.add_argument('--output', default='maze_analytics.jsonl', help="JSON lines results file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    count = 0
+    with open(args.output, 'w') as out:
+        for record in analyze_files(args.paths, args.workers, args.chunk_size):
+            out.write(json.dumps(record) + '\n')
+            count += 1
+    print(f"{count} mazes analyzed -> {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Headless benchmarks for every generator and solver.
+
+Each algorithm runs on square mazes over a range of sizes with fixed seeds. Wall time is
+the best of a few runs; peak memory comes from one extra run under tracemalloc (kept
+separate because tracing slows Python-heavy loops down). Steps are cells carved for the
+generators and cells explored for the solvers. Results are written as JSON and can be
+compared against an earlier results file:
+
+    python maze_bench.py --output bench.json
+    python maze_bench.py --baseline bench.json --threshold 0.2
+
+The comparison exits with status 1 when any time or peak memory grew by more than the
+threshold, so it can gate changes in CI.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from maze_core import generate_maze
+from maze_model import GENERATORS, SOLVERS, Maze
+
+DEFAULT_SIZES = (10, 50, 200, 1000, 2000)
+
+# Every solver runs on the same maze, carved by this generator
+SOLVER_MAZE_ALGORITHM = 'kruskal'
+
+
+def _measure(run, repeat, budget):
+    """
+    Time `run` (which returns its step count) and record its peak traced memory.
+
+    Fast runs are repeated (up to `repeat` times) until `budget` seconds have been spent,
+    so sub-millisecond benchmarks get a stable minimum; slow ones run once.
+
+    Returns:
+        tuple: (best seconds, peak bytes, steps)
+    """
+    best = float('inf')
+    spent = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        steps = run()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent >= budget:
+            break
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, steps
+
+
+def _record(kind, name, size, seconds, peak, steps):
+    return {
+        'kind': kind,
+        'name': name,
+        'width': size,
+        'height': size,
+        'seconds': seconds,
+        'peak_bytes': peak,
+        'steps': steps,
+        'steps_per_second': steps / seconds if seconds else None,
+    }
+
+
+def run_benchmarks(generators, solvers, sizes, seed=0, repeat=25, budget=0.5, max_seconds=30.0,
+                   log=None):
+    """
+    Benchmark the named generators and solvers at each size.
+
+    An algorithm is dropped from the larger sizes once one of its runs takes longer than
+    `max_seconds`, since those would only take longer.
+
+    Returns:
+        list: One result dict per (algorithm, size).
+    """
+    results = []
+    too_slow = set()
+    for size in sizes:
+        for name in generators:
+            if ('generator', name) in too_slow:
+                continue
+            carve = GENERATORS[name]
+
+            def run():
+                carve(generate_maze(size, size), size, size, visualize=False, rng=seed)
+                return size * size
+
+            result = _record('generator', name, size, *_measure(run, repeat, budget))
+            results.append(result)
+            if log:
+                log(result)
+            if result['seconds'] > max_seconds:
+                too_slow.add(('generator', name))
+
+        if not solvers:
+            continue
+        maze = Maze.generate(size, size, SOLVER_MAZE_ALGORITHM, seed=seed)
+        for name in solvers:
+            if ('solver', name) in too_slow:
+                continue
+            solve = SOLVERS[name]
+
+            def run():
+                _, explored = solve(maze.grid.copy(), visualize=False,
+                                    entrance=maze.entrance, exit=maze.exit)
+                return explored
+
+            result = _record('solver', name, size, *_measure(run, repeat, budget))
+            results.append(result)
+            if log:
+                log(result)
+            if result['seconds'] > max_seconds:
+                too_slow.add(('solver', name))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline results list.
+
+    Returns:
+        list: (result, baseline result, metric, ratio) for every time or peak memory that
+        grew by more than `threshold` (0.2 = 20%).
+    """
+    previous = {(r['kind'], r['name'], r['width'], r['height']): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result['kind'], result['name'], result['width'], result['height']))
+        if before is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            if before[metric] and result[metric] / before[metric] > 1 + threshold:
+                regressions.append((result, before, metric, result[metric] / before[metric]))
+    return regressions
+
+
+def _print_result(result):
+    rate = result['steps_per_second']
+    print(f"{result['kind']:9} {result['name']:10} {result['width']:>5}x{result['height']:<5} "
+          f"{result['seconds'] * 1000:10.2f} ms  {result['peak_bytes'] / 2 ** 20:9.2f} MiB  "
+          f"{rate:14,.0f} steps/s", flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the maze generators and solvers.")
+    parser.add_argument('--generators', nargs='*', choices=sorted(GENERATORS),
+                        default=sorted(GENERATORS))
+    parser.add_argument('--solvers', nargs='*', choices=sorted(SOLVERS), default=sorted(SOLVERS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES,
+                        help="square maze sizes in cells")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=25,
+                        help="most timed runs per benchmark (the best is kept)")
+    parser.add_argument('--budget', type=float, default=0.5,
+                        help="stop repeating a benchmark after this many seconds")
+    parser.add_argument('--max-seconds', type=float, default=30.0,
+                        help="skip larger sizes for an algorithm once a run takes longer")
+    parser.add_argument('--output', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="results JSON file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed relative growth in time or peak memory")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run_benchmarks(args.generators, args.solvers, args.sizes, args.seed, args.repeat,
+                             args.budget, args.max_seconds, log=_print_result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'machine': platform.machine(),
+                'seed': args.seed,
+                'results': results,
+            }, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for result, before, metric, ratio in regressions:
+            print(f"REGRESSION {result['kind']} {result['name']} {result['width']}x{result['height']}: "
+                  f"{metric} {before[metric]:.4g} -> {result[metric]:.4g} ({ratio:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Two-tier cache of generated mazes keyed on (algorithm, width, height, seed).
+
+Every generator is deterministic for a given seed, so a seeded maze never has to be
+generated twice: recently used mazes are kept in memory (least recently used evicted first), and
+every maze is also written to a directory as a .amz file, with the least recently used
+files deleted once the directory grows past its byte budget. Unseeded mazes are
+different every time and bypass the cache.
+"""
+import os
+from collections import OrderedDict
+
+from maze_io import check_seed, load_maze, save_maze
+from maze_model import Maze
+
+
+class MazeCache:
+    """
+    Memory and disk cache in front of Maze.generate().
+
+    get() always returns a fresh copy of the grid, so callers may solve (and mark) the
+    maze they get without corrupting the cached one.
+
+    Attributes:
+        directory (str): Directory of the disk tier, or None for memory only
+        memory_items (int): Number of mazes kept in memory
+        disk_bytes (int): Size the disk tier is trimmed back to after each write
+        hits (dict): Lookups served by each tier ('memory', 'disk') and generated ('miss')
+    """
+
+    def __init__(self, directory=None, memory_items=128, disk_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.memory_items = memory_items
+        self.disk_bytes = disk_bytes
+        self.hits = {'memory': 0, 'disk': 0, 'miss': 0}
+        self._memory = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        algorithm, width, height, seed = key
+        return os.path.join(self.directory, f"{algorithm}-{width}x{height}-{seed}.amz")
+
+    def get(self, algorithm, width, height, seed):
+        """
+        Return the maze for (algorithm, width, height, seed), generating it on a miss.
+
+        A seed of None generates a new random maze every call, which is never cached.
+
+        Returns:
+            Maze: A maze whose grid the caller owns.
+
+        Raises:
+            ValueError: When the seed is not an integer from 0 to maze_io.MAX_SEED.
+        """
+        seed = check_seed(seed)
+        if seed is None:
+            self.hits['miss'] += 1
+            return Maze.generate(width, height, algorithm)
+
+        key = (algorithm, width, height, seed)
+        maze = self._memory.get(key)
+        if maze is not None:
+            self._memory.move_to_end(key)
+            self.hits['memory'] += 1
+            return self._copy(maze)
+
+        path = self._path(key) if self.directory else None
+        if path and os.path.exists(path):
+            maze = load_maze(path)
+            os.utime(path)  # Mark as recently used for eviction
+            self.hits['disk'] += 1
+        else:
+            maze = Maze.generate(width, height, algorithm, seed=seed)
+            self.hits['miss'] += 1
+            if path:
+                save_maze(path, maze)
+                self._trim_disk()
+
+        self._remember(key, maze)
+        return self._copy(maze)
+
+    def clear_memory(self):
+        """Drop the memory tier; the disk tier is left alone."""
+        self._memory.clear()
+
+    def _remember(self, key, maze):
+        self._memory[key] = maze
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _copy(maze):
+        return Maze(maze.grid.copy(), maze.algorithm, maze.seed, maze.entrance, maze.exit)
+
+    def _trim_disk(self):
+        """Delete the least recently used files until the directory fits in disk_bytes."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith('.amz'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_bytes:
+                break
+            os.remove(path)
+            total -= size
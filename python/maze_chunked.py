@@ -0,0 +1,169 @@
+"""
+Chunked parallel generation for mazes too large for one core.
+
+The maze is cut into tiles of tile_size x tile_size cells. Each tile is carved on its
+own by any of the GENERATORS in a process pool, and written straight into the output
+grid, which lives either in shared memory or in a memory-mapped .npy file. The tiles are
+then joined through a random spanning tree over the tile graph, with one opening at a
+random cell along every boundary the tree uses. Every tile is a spanning tree of its own
+cells, so the result is still a perfect maze:
+
+    python maze_chunked.py --width 20000 --height 20000 --tile-size 1000 --workers 32 \\
+        --output maze.npy
+
+The result is not uniform over all perfect mazes, even when each tile is: exactly one
+passage crosses each used tile boundary, so the tile layout shows at large scale.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from maze_core import (
+    generate_maze,
+    add_maze_entrance_and_exit,
+    kruskal_tree,
+    numpy_rng,
+    resolve_rng,
+)
+from maze_model import GENERATORS
+
+
+def tile_bounds(size, tile_size):
+    """Cell offsets where tiles start along one axis, plus `size` at the end."""
+    return list(range(0, size, tile_size)) + [size]
+
+
+def _open_output(target, shape):
+    """Map the output grid in a worker: a shared memory block name or a .npy path."""
+    if target.endswith('.npy'):
+        return None, np.load(target, mmap_mode='r+')
+    block = shared_memory.SharedMemory(name=target)
+    return block, np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+
+
+def _carve_tile(args):
+    """Worker: carve one tile and write its grid, borders included, into the output."""
+    target, shape, algorithm, x0, y0, width, height, seed = args
+    tile = GENERATORS[algorithm](generate_maze(width, height), width, height, visualize=False,
+                                 rng=seed)
+    block, grid = _open_output(target, shape)
+    # Neighbouring tiles both write their shared border, which is all wall in either
+    grid[2 * y0:2 * (y0 + height) + 1, 2 * x0:2 * (x0 + width) + 1] = tile
+    if block is None:
+        grid.flush()
+    else:
+        del grid
+        block.close()
+    return width * height
+
+
+def generate_chunked(width, height, algorithm='kruskal', tile_size=512, seed=None, workers=None,
+                     output=None):
+    """
+    Generate a perfect maze tile by tile across a process pool.
+
+    The tile seeds, the tile spanning tree and the openings all come from `seed`, so the
+    maze does not depend on the number of workers.
+
+    Args:
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        algorithm (str): Key into GENERATORS, used for every tile
+        tile_size (int): Side of a tile in cells
+        seed (int): Seed for the whole maze, or None for a random one
+        workers (int): Worker processes (default: one per CPU)
+        output (str): .npy file to build the grid in as a memory map; without one the grid
+            is built in shared memory and returned as an ordinary array
+
+    Returns:
+        numpy.ndarray: The grid with its entrance and exit, as an np.memmap when `output`
+        is given.
+    """
+    rng = resolve_rng(seed)
+    shape = (2 * height + 1, 2 * width + 1)
+    xs, ys = tile_bounds(width, tile_size), tile_bounds(height, tile_size)
+    tiles_x, tiles_y = len(xs) - 1, len(ys) - 1
+    seeds = [rng.getrandbits(63) for _ in range(tiles_x * tiles_y)]
+
+    block = None
+    if output:
+        grid = np.lib.format.open_memmap(output, mode='w+', dtype=np.uint8, shape=shape)
+        del grid  # Workers map the file themselves
+        target = output
+    else:
+        block = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1])
+        target = block.name
+
+    try:
+        tasks = [(target, shape, algorithm, xs[i], ys[j], xs[i + 1] - xs[i], ys[j + 1] - ys[j],
+                  seeds[j * tiles_x + i])
+                 for j in range(tiles_y) for i in range(tiles_x)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(_carve_tile, tasks):
+                pass
+
+        if output:
+            grid = np.load(output, mmap_mode='r+')
+        else:
+            grid = np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+        _stitch(grid, xs, ys, numpy_rng(rng))
+        add_maze_entrance_and_exit(grid)
+
+        if output:
+            grid.flush()
+            return grid
+        result = grid.copy()
+        del grid
+        return result
+    finally:
+        if block is not None:
+            block.close()
+            block.unlink()
+
+
+def _stitch(grid, xs, ys, rng):
+    """Open one passage across every tile boundary in a random spanning tree of the tiles."""
+    tiles_x, tiles_y = len(xs) - 1, len(ys) - 1
+    first, second, _ = kruskal_tree(tiles_x, tiles_y, rng)
+    for a, b in zip(first.tolist(), second.tolist()):
+        i, j = a % tiles_x, a // tiles_x
+        if b == a + 1 and b % tiles_x:
+            # Tiles side by side: a random row of the left tile, through their shared column
+            y = int(rng.integers(ys[j], ys[j + 1]))
+            grid[2 * y + 1, 2 * xs[i + 1]] = 0
+        else:
+            # Tiles one above the other: a random column, through their shared row
+            x = int(rng.integers(xs[i], xs[i + 1]))
+            grid[2 * ys[j + 1], 2 * x + 1] = 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate one giant maze across a process pool.")
+    parser.add_argument('--algorithm', choices=sorted(GENERATORS), default='kruskal')
+    parser.add_argument('--width', type=int, default=4000, help="maze width in cells")
+    parser.add_argument('--height', type=int, default=4000, help="maze height in cells")
+    parser.add_argument('--tile-size', type=int, default=512, help="tile side in cells")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--output', default='maze.npy', help=".npy file for the grid")
+    args = parser.parse_args(argv)
+    if args.width < 2 or args.height < 2 or args.tile_size < 1:
+        parser.error("width and height must be at least 2 and tile size at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.perf_counter()
+    generate_chunked(args.width, args.height, args.algorithm, args.tile_size, args.seed,
+                     args.workers, args.output)
+    print(f"{args.width}x{args.height} maze in {time.perf_counter() - start:.2f}s "
+          f"-> {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Bit-packed maze storage: two bits per cell instead of a full (2h+1)x(2w+1) grid.
+
+Every cell only owns its east and south walls; the west and north walls belong to the
+neighbouring cells and the outer border is implicit. Bits are packed eight cells to a byte
+with np.packbits, so a maze costs about width * height / 4 bytes. to_grid() and
+grid_rows() expand back to the 0/1 grid layout used by the renderer and the solvers.
+"""
+import numpy as np
+
+
+class CompactMaze:
+    """
+    A maze stored as packed east/south wall bits.
+
+    Attributes:
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        east (numpy.ndarray): (height, ceil(width / 8)) uint8, bit set = east wall present
+        south (numpy.ndarray): (height, ceil(width / 8)) uint8, bit set = south wall present
+    """
+
+    def __init__(self, width, height, east=None, south=None):
+        self.width = width
+        self.height = height
+        row_bytes = (width + 7) // 8
+        # A fresh maze has every wall standing
+        self.east = east if east is not None else np.full((height, row_bytes), 0xFF, dtype=np.uint8)
+        self.south = south if south is not None else np.full((height, row_bytes), 0xFF, dtype=np.uint8)
+
+    @classmethod
+    def from_grid(cls, grid):
+        """
+        Pack a (2h+1)x(2w+1) grid from generate_maze() and the carve functions.
+
+        Only a 1 in a wall position counts as a wall; any other value, including solver
+        marks (2-5) on passages, is read as open.
+        """
+        height, width = (grid.shape[0] - 1) // 2, (grid.shape[1] - 1) // 2
+        east = np.packbits(grid[1::2, 2::2] == 1, axis=1)
+        south = np.packbits(grid[2::2, 1::2] == 1, axis=1)
+        return cls(width, height, east, south)
+
+    @classmethod
+    def from_rows(cls, rows, width, height):
+        """
+        Pack a maze from a stream of grid rows (e.g. eller_rows()) without ever holding the
+        full grid.
+        """
+        maze = cls(width, height)
+        for y, row in enumerate(rows):
+            if y == 0 or y == 2 * height:
+                continue
+            if y % 2:
+                maze.east[y // 2] = np.packbits(row[2::2] == 1)
+            else:
+                maze.south[y // 2 - 1] = np.packbits(row[1::2] == 1)
+        return maze
+
+    @property
+    def nbytes(self):
+        """Bytes used by the wall bits."""
+        return self.east.nbytes + self.south.nbytes
+
+    def _bits(self, packed, y_start, y_stop):
+        return np.unpackbits(packed[y_start:y_stop], axis=1, count=self.width).astype(bool)
+
+    def has_east_wall(self, x, y):
+        """Whether the wall between cell (x, y) and (x + 1, y) is standing."""
+        return bool(self.east[y, x >> 3] & (0x80 >> (x & 7)))
+
+    def has_south_wall(self, x, y):
+        """Whether the wall between cell (x, y) and (x, y + 1) is standing."""
+        return bool(self.south[y, x >> 3] & (0x80 >> (x & 7)))
+
+    def grid_rows(self, y_start=0, y_stop=None, dtype=np.uint8):
+        """
+        Expand cell rows y_start..y_stop to grid layout.
+
+        Returns grid rows 2 * y_start through 2 * y_stop inclusive (the wall rows above and
+        below the band), so bands can be converted independently for tiled rendering or
+        solving.
+        """
+        y_stop = self.height if y_stop is None else y_stop
+        bands = y_stop - y_start
+        grid = np.ones((2 * bands + 1, 2 * self.width + 1), dtype=dtype)
+        grid[1::2, 1::2] = 0
+        grid[1::2, 2:-1:2] = self._bits(self.east, y_start, y_stop)[:, :-1]
+
+        # South walls of the band's cells fill the wall rows below them; the row above the
+        # band belongs to the cells just outside it (or is the border)
+        south = self._bits(self.south, max(y_start - 1, 0), y_stop)
+        if y_start > 0:
+            grid[0, 1::2] = south[0]
+            south = south[1:]
+        grid[2:-1:2, 1::2] = south[:-1]
+        if y_stop < self.height:
+            grid[-1, 1::2] = south[-1]
+        return grid
+
+    def to_grid(self, dtype=np.uint8):
+        """Expand to the full (2h+1)x(2w+1) grid with 0 = path and 1 = wall."""
+        return self.grid_rows(dtype=dtype)
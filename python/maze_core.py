@@ -0,0 +1,1547 @@
+"""
+Headless maze engine: grid setup, generators, solvers and entrance/exit placement.
+
+Nothing in this module imports pygame. Animation and sound are only pulled in
+(lazily, through maze_view) when a caller passes a pygame screen.
+"""
+import functools
+import heapq
+import numbers
+import random
+from itertools import permutations
+
+import numpy as np
+
+from maze_events import Event
+
+# Maximum number of directions drawn at once by the Aldous-Broder random walk
+WALK_BATCH = 1 << 20
+
+# Pass as `screen` to get animation steps with no display and no sound (e.g. for recording)
+OFFSCREEN = object()
+
+
+def _view():
+    """Import the pygame front end on first use so headless callers never load it."""
+    import maze_view
+    return maze_view
+
+
+def _run_steps(steps, screen):
+    """
+    Drive a step generator to completion and return its result.
+
+    Every public generator and solver is a thin wrapper around a `*_steps` generator with
+    the same arguments. When animating, the generator yields one
+    (frame, current_cell, changed) tuple per algorithm step: the grid to draw, the (x, y)
+    cell to highlight (or None), and the flat indices of the frame squares written since
+    the previous step, or None when the whole frame has to be compared. Writes made after
+    a generator's last step, and the first step on a different frame array, are not
+    covered by `changed`. The frame arrays are live, so a step is only valid until the
+    next one is requested. Headless, nothing is ever yielded and the generator simply runs.
+
+    With a screen the steps go through maze_view.play_steps(), which advances as many
+    steps as the animation speed allows per frame and draws once per frame.
+    """
+    if screen is not None and screen is not OFFSCREEN:
+        return _view().play_steps(screen, steps)
+    try:
+        while True:
+            next(steps)
+    except StopIteration as done:
+        return done.value
+
+
+def _play(screen, sound_name):
+    """Play a named sound effect, but only when running with a display."""
+    if screen is not None and screen is not OFFSCREEN:
+        _view().play_sound(sound_name)
+
+
+def _observed(func):
+    """
+    Report a generator or solver as a phase to its `observer` keyword argument.
+
+    Without an observer the call goes straight through.
+    """
+    @functools.wraps(func)
+    def run(*args, observer=None, **kwargs):
+        if observer is None:
+            return func(*args, **kwargs)
+        observer.phase_started(func.__name__)
+        try:
+            return func(*args, observer=observer, **kwargs)
+        finally:
+            observer.phase_finished(func.__name__)
+    return run
+
+
+def generate_maze(width, height):
+    maze = np.ones((2 * height + 1, 2 * width + 1), dtype=np.uint8)
+
+    # Carve out passageways
+    maze[1::2, 1::2] = 0  # Make every odd cell a passage
+
+    return maze
+
+
+def _border_flags(maze):
+    """Return a bytearray over the flat grid with 1 on the outer border, 0 inside."""
+    border = np.zeros(maze.shape, dtype=np.uint8)
+    border[[0, -1], :] = 1
+    border[:, [0, -1]] = 1
+    return bytearray(border.tobytes())
+
+
+def resolve_rng(rng):
+    """
+    Turn the `rng` argument of the generators into an object with the random module's API.
+
+    None uses the shared state of the random module, an integer (including NumPy integers)
+    seeds a fresh random.Random and anything else (a random.Random) is used as is.
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, numbers.Integral):
+        return random.Random(int(rng))
+    return rng
+
+
+def numpy_rng(rng):
+    """A NumPy generator seeded from a resolved rng, so one seed fixes both streams."""
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+@_observed
+def carve_passages_wilson(maze, width, height, screen=None, visualize=True, rng=None, observer=None):
+    """
+    Generate a maze using Wilson's algorithm (Loop-Erased Random Walk).
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_wilson_steps(maze, width, height, screen, visualize, rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_wilson_steps(maze, width, height, screen=None, visualize=True, rng=None,
+                                observer=None):
+    """Step generator behind carve_passages_wilson(); see _run_steps()."""
+    cols = maze.shape[1]
+
+    rng = resolve_rng(rng)
+
+    # Choose a random starting cell as the root of the tree
+    start_cell = (2 * rng.randrange(height) + 1) * cols + 2 * rng.randrange(width) + 1
+    return (yield from _carve_loop_erased(maze, [start_cell], screen, visualize, rng, observer))
+
+
+def _carve_loop_erased(maze, tree_cells, screen=None, visualize=True, rng=random, observer=None):
+    """
+    Step generator growing a spanning tree over every cell with loop-erased random walks.
+
+    Unvisited cells live in an indexable pool with a position table, so picking a random
+    walk start and removing cells are O(1). The current walk records each cell's position
+    in `walk_pos`, which makes erasing a loop cost only the length of the erased segment.
+
+    Args:
+        maze (numpy.ndarray): Maze grid; walls already carved between `tree_cells` are kept
+        tree_cells (list): Flat grid indices of the cells already in the tree (at least one)
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random): Random source, already resolved by the caller
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    rows, cols = maze.shape
+    border = _border_flags(maze)
+    rand = rng.random
+    animate = visualize and screen
+
+    # Steps between neighbouring cells in flat grid indices: Right, Down, Left, Up
+    directions = (2, 2 * cols, -2, -2 * cols)
+
+    in_tree = bytearray(maze.size)
+    for cell in tree_cells:
+        in_tree[cell] = 1
+
+    # Pool of unvisited cells plus each cell's slot in it, for O(1) random removal
+    pool = [cell for cell in (y * cols + x for y in range(1, rows, 2) for x in range(1, cols, 2))
+            if not in_tree[cell]]
+    pool_pos = [-1] * maze.size
+    for i, cell in enumerate(pool):
+        pool_pos[cell] = i
+
+    def take(cell):
+        """Swap-remove `cell` from the unvisited pool."""
+        i = pool_pos[cell]
+        last = pool.pop()
+        if last != cell:
+            pool[i] = last
+            pool_pos[last] = i
+        pool_pos[cell] = -1
+
+    walk_pos = [-1] * maze.size  # Position of each cell in the current walk, -1 when not on it
+    carved = []
+
+    # Cells and carved walls of the finished tree with the current walk painted on top,
+    # only kept up to date when animating
+    if animate:
+        tree = maze.astype(np.uint8)
+        tree.flat[pool] = 1
+
+    while pool:
+        # Choose an unvisited cell as the random walk start
+        current = pool[int(rand() * len(pool))]
+        path = [current]
+        walk_pos[current] = 0
+        if animate:
+            tree.flat[current] = 4
+            changed = [current]
+
+        # Perform random walk until we hit a visited cell
+        while not in_tree[current]:
+            # Pick a random direction, redrawing the ones that would cross the border
+            step = directions[int(rand() * 4)]
+            while border[current + step // 2]:
+                step = directions[int(rand() * 4)]
+            current += step
+
+            loop_index = walk_pos[current]
+            if loop_index >= 0:
+                # Erase the loop back to the first visit of `current`
+                if observer:
+                    observer.event(Event.LOOP_ERASED, 1, len(path) - loop_index - 1)
+                for cell in path[loop_index + 1:]:
+                    walk_pos[cell] = -1
+                if animate:
+                    erased = path[loop_index + 1:]
+                    erased += [(a + b) // 2 for a, b in zip(path[loop_index:], erased)]
+                    tree.flat[erased] = 1
+                    changed += erased
+                del path[loop_index + 1:]
+            else:
+                if animate:
+                    tree.flat[current] = tree.flat[(path[-1] + current) // 2] = 4
+                    changed += [current, (path[-1] + current) // 2]
+                walk_pos[current] = len(path)
+                path.append(current)
+
+            # Visualization of the random walk
+            if animate:
+                yield tree, None, changed
+                changed = []
+
+        # Connect the path to the maze
+        walk_pos[path[-1]] = -1
+        for cell, next_cell in zip(path, path[1:]):
+            wall = (cell + next_cell) // 2
+            carved.append(wall)
+            in_tree[cell] = 1
+            walk_pos[cell] = -1
+            take(cell)
+            if animate:
+                tree.flat[cell] = tree.flat[wall] = 0
+                changed += [cell, wall]
+
+        if observer:
+            observer.event(Event.CELL_CARVED, len(path) - 1)
+            observer.event(Event.WALL_REMOVED, len(path) - 1)
+
+        # Visualization of the maze progress
+        if animate:
+            # The walk ended on a tree cell, which loses its in-progress paint
+            tree.flat[path[-1]] = 0
+            yield tree, None, changed + [path[-1]]
+
+    # Write every carved wall back in one scatter
+    carved = np.array(carved, dtype=np.intp)
+    maze[carved // cols, carved % cols] = 0
+    return maze
+
+
+@_observed
+def carve_passages_prim(maze, width, height, screen=None, visualize=True, rng=None, observer=None):
+    """
+    Generate a maze using randomized Prim's algorithm.
+
+    The frontier is a list of flat grid indices of walls bordering the maze built so far.
+    A wall is picked uniformly at random and removed by swapping in the last entry, so
+    every step is O(1), and a per-position flag keeps each wall from being queued twice.
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_prim_steps(maze, width, height, screen, visualize, rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_prim_steps(maze, width, height, screen=None, visualize=True, rng=None,
+                              observer=None):
+    """Step generator behind carve_passages_prim(); see _run_steps()."""
+    rows, cols = maze.shape
+    visited = bytearray(maze.size)
+    frontier = []
+    carved = []
+    rand = resolve_rng(rng).random
+    animate = visualize and screen
+
+    # Border walls are flagged as already queued so they never enter the frontier
+    queued = _border_flags(maze)
+
+    # Start from the top-left cell; its walls seed the frontier
+    new_cell = cols + 1
+    visited[new_cell] = 1
+
+    while True:
+        # Queue the walls around the cell that just joined the maze
+        for neighbor_wall in (new_cell - 1, new_cell + 1, new_cell - cols, new_cell + cols):
+            if not queued[neighbor_wall]:
+                queued[neighbor_wall] = 1
+                frontier.append(neighbor_wall)
+
+        if not frontier:
+            break
+
+        # Pick a random wall and swap-remove it from the frontier
+        i = int(rand() * len(frontier))
+        wall = frontier[i]
+        last = frontier.pop()
+        if i < len(frontier):
+            frontier[i] = last
+
+        # Walls on odd rows separate left/right cells, walls on even rows separate up/down cells
+        if (wall // cols) % 2:
+            a, b = wall - 1, wall + 1
+        else:
+            a, b = wall - cols, wall + cols
+
+        # Only carve when exactly one side is already part of the maze
+        if visited[a] and visited[b]:
+            continue
+        new_cell = b if visited[a] else a
+        visited[new_cell] = 1
+        carved.append(wall)
+        if observer:
+            observer.event(Event.CELL_CARVED)
+            observer.event(Event.WALL_REMOVED)
+        if animate:
+            maze.flat[wall] = 0
+            yield maze, (new_cell % cols, new_cell // cols), [wall]
+
+    # Write every carved wall back in one scatter
+    carved = np.array(carved, dtype=np.intp)
+    maze[carved // cols, carved % cols] = 0
+    return maze
+
+
+def _folded_walk(start, increments, size):
+    """
+    Positions of a 1-D walk on 0..size-1 that stays put instead of stepping off either end.
+
+    The walk is run unconstrained on a cycle of length 2 * size and folded in half: a step
+    across the fold lands on the same position, which is exactly a blocked move, and on
+    the mirrored half the increments change sign, which leaves their symmetric
+    distribution unchanged. So one cumulative sum gives the whole batch.
+    """
+    positions = (start + np.cumsum(increments, dtype=np.int64)) % (2 * size)
+    return np.where(positions < size, positions, 2 * size - 1 - positions)
+
+
+def _random_walk(rng, x, y, width, height, steps):
+    """
+    Advance a lazy random walk on the cell grid by `steps` pre-drawn directions.
+
+    Blocked moves leave the walk in place. Returns the cell indices (y * width + x) of the
+    start followed by every position after each step.
+    """
+    directions = rng.integers(0, 4, size=steps, dtype=np.int8)
+    # Right, Down, Left, Up
+    dx = (directions == 0).astype(np.int8) - (directions == 2)
+    dy = (directions == 1).astype(np.int8) - (directions == 3)
+    xs = _folded_walk(x, dx, width)
+    ys = _folded_walk(y, dy, height)
+    return np.concatenate(([y * width + x], ys * width + xs))
+
+
+def _replay_walk(maze, walk, first, walls, width, finished):
+    """
+    Animate one batch of the Aldous-Broder walk a step at a time, opening each wall as the
+    walk enters its new cell. Once the walk is finished it stops at its last new cell.
+    """
+    opened = dict(zip(first.tolist(), walls.tolist()))
+    last = int(first[-1]) if finished else len(walk) - 1
+    for step in range(1, last + 1):
+        wall = opened.get(step)
+        changed = []
+        if wall is not None:
+            maze.flat[wall] = 0
+            changed.append(wall)
+        cell = int(walk[step])
+        yield maze, (2 * (cell % width) + 1, 2 * (cell // width) + 1), changed
+
+
+def _cell_to_grid(cells, width, cols):
+    """Map cell indices (y * width + x) to flat indices in the (2h+1)x(2w+1) grid."""
+    return (2 * (cells // width) + 1) * cols + 2 * (cells % width) + 1
+
+
+@_observed
+def carve_passages_aldous(maze, width, height, screen=None, visualize=True, switch_fraction=None,
+                          rng=None, observer=None):
+    """
+    Generate a maze using the Aldous-Broder algorithm.
+
+    The walk is advanced a batch at a time: directions are drawn in bulk from a NumPy
+    generator, the x and y coordinates are integrated with cumulative sums, and the
+    cells entered for the first time are picked out with one np.unique call. Blocked
+    moves leave the walk in place, which does not change the order in which cells are
+    first entered, so the result is still a uniform spanning tree.
+
+    With `switch_fraction` set, the walk stops once that fraction of the cells has been
+    visited and the remaining cells are attached with Wilson's loop-erased walks, which
+    skips Aldous-Broder's long tail of revisits. The hand-off is not exactly uniform
+    (how the walk would have continued depends on where it stopped), so leave it as None
+    when an unbiased maze is required.
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        switch_fraction (float): Fraction of visited cells at which to hand over to
+            Wilson's algorithm, or None to run Aldous-Broder to completion
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_aldous_steps(maze, width, height, screen, visualize, switch_fraction,
+                                        rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_aldous_steps(maze, width, height, screen=None, visualize=True,
+                                switch_fraction=None, rng=None, observer=None):
+    """Step generator behind carve_passages_aldous(); see _run_steps()."""
+    cols = maze.shape[1]
+    total = width * height
+    animate = visualize and screen
+    source = resolve_rng(rng)
+    rng = numpy_rng(source)
+
+    visited = np.zeros(total, dtype=bool)
+    current = int(rng.integers(total))
+    visited[current] = True
+    count = 1
+    target = total if switch_fraction is None else max(1, min(total, int(switch_fraction * total)))
+
+    # Long batches amortize the NumPy calls; small grids would mostly waste them. The batch
+    # size does not depend on animating, so a seed gives the same maze either way
+    batch = min(WALK_BATCH, 8 * total)
+    carved = []
+
+    while count < target:
+        # Advance the walk over a batch of pre-drawn directions
+        walk = _random_walk(rng, current % width, current // width, width, height, batch)
+        current = int(walk[-1])
+
+        # Cells entered for the first time in this batch, in walk order
+        fresh = np.flatnonzero(~visited[walk])
+        cells, first = np.unique(walk[fresh], return_index=True)
+        first = np.sort(fresh[first])[:target - count]
+
+        # Each new cell is joined to the cell the walk came from
+        new_cells, from_cells = walk[first], walk[first - 1]
+        visited[new_cells] = True
+        count += len(first)
+        walls = (_cell_to_grid(new_cells, width, cols) + _cell_to_grid(from_cells, width, cols)) // 2
+        if len(walls):
+            carved.append(walls)
+            if observer:
+                observer.event(Event.CELL_CARVED, len(walls))
+                observer.event(Event.WALL_REMOVED, len(walls))
+
+        if animate:
+            yield from _replay_walk(maze, walk, first, walls, width, count >= target)
+
+    if carved:
+        maze.flat[np.concatenate(carved)] = 0
+
+    if count < total:
+        tree_cells = _cell_to_grid(np.flatnonzero(visited), width, cols).tolist()
+        if observer:
+            observer.phase_started('_carve_loop_erased')
+        yield from _carve_loop_erased(maze, tree_cells, screen, visualize, source, observer)
+        if observer:
+            observer.phase_finished('_carve_loop_erased')
+
+    return maze
+
+
+@_observed
+def carve_passages_dfs(maze, width, height, screen=None, visualize=True, rng=None, observer=None):
+    """
+    Generate a maze using an iterative randomized Depth-First Search (recursive backtracker).
+
+    The stack holds flat grid indices in a preallocated array, beside a uint8 array with
+    each entry's next direction, and a padded `blocked` table marks walls, visited cells
+    and everything outside the grid, so a neighbour test is a single lookup and no
+    recursion is involved however long a corridor gets. Walls are removed from the grid as
+    they are carved.
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_dfs_steps(maze, width, height, screen, visualize, rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_dfs_steps(maze, width, height, screen=None, visualize=True, rng=None,
+                             observer=None):
+    """Step generator behind carve_passages_dfs(); see _run_steps()."""
+    cols = maze.shape[1]
+    animate = visualize and screen
+    rand = resolve_rng(rng).random
+
+    # Only unvisited cells are 0; the padding row absorbs steps off the bottom edge
+    blocked = bytearray(b'\x01') * (maze.size + 2 * cols)
+    np.frombuffer(blocked, dtype=np.uint8)[:maze.size].reshape(maze.shape)[1::2, 1::2] = 0
+
+    # Every cell visits its neighbours in one of the 24 orders. They are laid out five
+    # entries apart, each ending in a 0 offset, so a stack entry only needs the position of
+    # the next offset to try, and the 0 says the cell has none left.
+    offsets = [step for order in permutations((2, -2, 2 * cols, -2 * cols))
+               for step in order + (0,)]
+
+    # The stack holds at most every cell once. It lives in preallocated arrays, read and
+    # written through memoryviews, which index as plain Python ints.
+    capacity = (maze.shape[0] // 2) * (cols // 2)
+    index_type = np.int32 if len(blocked) < 2 ** 31 else np.int64
+    stack = memoryview(np.empty(capacity, dtype=index_type))
+    next_offset = memoryview(np.empty(capacity, dtype=np.uint8))
+    # Walls come down as they are carved, through a flat view of the grid when there is one
+    grid = maze.reshape(-1) if maze.flags.c_contiguous else maze.flat
+
+    start_cell = cols + 1
+    stack[0] = start_cell
+    next_offset[0] = 5 * int(rand() * 24)
+    blocked[start_cell] = 1
+    top = 0
+
+    while top >= 0:
+        cell = stack[top]
+        position = next_offset[top]
+        while True:
+            step = offsets[position]
+            position += 1
+            if not step or not blocked[cell + step]:
+                break
+        next_offset[top] = position
+
+        if not step:
+            # Handle backtracking
+            top -= 1
+            if observer:
+                observer.event(Event.BACKTRACK)
+
+            if animate and top >= 0:
+                # Paint the backtracked cell and the wall leading back to it as in progress
+                wall = (cell + stack[top]) // 2
+                grid[cell] = grid[wall] = 4
+                yield maze, (wall % cols, wall // cols), [cell, wall]
+            continue
+
+        next_cell = cell + step
+        wall = (cell + next_cell) // 2
+        blocked[next_cell] = 1
+        grid[wall] = 0  # Remove the wall
+        if observer:
+            observer.event(Event.CELL_CARVED)
+            observer.event(Event.WALL_REMOVED)
+        top += 1
+        stack[top] = next_cell
+        next_offset[top] = 5 * int(rand() * 24)
+
+        if animate:
+            yield maze, (next_cell % cols, next_cell // cols), [wall]
+
+    if animate:
+        # Clear the backtracking paint
+        maze[maze == 4] = 0
+    return maze
+
+
+def entrance_and_exit(maze):
+    """
+    Return the (x, y) grid positions add_maze_entrance_and_exit() marks, without touching
+    the grid: the top border above the top-left cell and the bottom border below the
+    bottom-right cell.
+    """
+    rows, cols = maze.shape
+    return (1, 0), (cols - 2, rows - 1)
+
+
+def add_maze_entrance_and_exit(maze):
+    """
+    Add an entrance (2) above the top-left cell and an exit (3) below the bottom-right cell.
+
+    Args:
+        maze (numpy.ndarray): The maze grid where 0 represents paths and 1 represents walls.
+
+    Returns:
+        numpy.ndarray: The maze grid with entrance (2) and exit (3) added to the border.
+    """
+    entrance, exit = entrance_and_exit(maze)
+    maze[entrance[1], entrance[0]] = 2
+    maze[exit[1], exit[0]] = 3
+    return maze
+
+
+def find_markers(maze):
+    """Return the (x, y) positions of the entrance (2) and exit (3), or None when missing."""
+    cols = maze.shape[1]
+    found = []
+    for value in (2, 3):
+        hits = np.flatnonzero(maze == value)
+        found.append((int(hits[-1] % cols), int(hits[-1] // cols)) if len(hits) else None)
+    return found
+
+
+def _solver_grid(maze, entrance, exit):
+    """
+    Shared set-up for the solvers.
+
+    The solvers work on flat indices into the grid padded with a wall ring, so no move can
+    leave the array and a neighbour is just an offset away.
+
+    Returns:
+        tuple: (passable, padded_cols, start, goal), where passable is a flat bool array
+        and start/goal are the padded flat indices of the entrance and exit.
+    """
+    padded_cols = maze.shape[1] + 2
+    passable = np.pad((maze == 0) | (maze == 3), 1).ravel()
+    start = (entrance[1] + 1) * padded_cols + entrance[0] + 1
+    goal = (exit[1] + 1) * padded_cols + exit[0] + 1
+    return passable, padded_cols, start, goal
+
+
+def _padded_to_xy(indices, padded_cols):
+    """Map padded flat indices back to (x, y) arrays in the unpadded grid."""
+    return indices % padded_cols - 1, indices // padded_cols - 1
+
+
+def trace_path(came_from, start, goal, directions):
+    """
+    Walk the direction codes in `came_from` back from `goal` to `start`.
+
+    Returns the padded flat indices from start to goal.
+    """
+    path = [goal]
+    cell = goal
+    while cell != start:
+        cell -= directions[came_from[cell]]
+        path.append(cell)
+    path.reverse()
+    return path
+
+
+def _mark_solution(maze, solution, exit, screen, animate):
+    """
+    Step generator marking the solution cells as 5, one step per cell when animating.
+    The exit is marked as explored (4) first.
+    """
+    if animate:
+        cols = maze.shape[1]
+        maze[exit[1], exit[0]] = 4
+        changed = [exit[1] * cols + exit[0]]
+        for px, py in solution:
+            maze[py, px] = 5  # Mark as part of the solution path
+            _play(screen, 'path_create')
+            yield maze, None, changed + [py * cols + px]
+            changed = []
+        _play(screen, 'path_complete')
+    else:
+        xs, ys = np.array(solution).T
+        maze[ys, xs] = 5
+
+
+@_observed
+def solve_maze_dfs(maze, screen=None, visualize=True, entrance=None, exit=None, observer=None):
+    """
+    Solve the maze using an iterative Depth-First Search (DFS), optionally visualizing it.
+
+    The path is a stack in a preallocated array, and each entry keeps the index of the next
+    direction to try in a parallel uint8 array, so the search needs no recursion. Without a screen, explored cells are never written to the grid: the only
+    lasting change is the solution path, which is marked in one scatter at the end.
+
+    Args:
+        maze (numpy.ndarray): The maze grid where 0 = path, 1 = wall, 2 = entrance, 3 = exit.
+        screen (pygame.Surface): Pygame screen for visualization.
+        visualize (bool): Whether to visualize the process.
+        entrance (tuple): Known (x, y) of the entrance; the grid is scanned when omitted.
+        exit (tuple): Known (x, y) of the exit; the grid is scanned when omitted.
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        tuple: (path, explored) where path is the list of (x, y) cells from entrance to exit
+        (empty when the exit is unreachable) and explored is the number of cells the search
+        entered. None when the maze has no entrance or exit.
+    """
+    steps = solve_maze_dfs_steps(maze, screen, visualize, entrance, exit, observer)
+    return _run_steps(steps, screen)
+
+
+def solve_maze_dfs_steps(maze, screen=None, visualize=True, entrance=None, exit=None,
+                         observer=None):
+    """Step generator behind solve_maze_dfs(); see _run_steps()."""
+    if entrance is None or exit is None:
+        entrance, exit = find_markers(maze)
+    if not entrance or not exit:
+        print("Maze must have an entrance (2) and exit (3).")
+        return
+
+    animate = visualize and screen
+
+    passable, padded_cols, start, goal = _solver_grid(maze, entrance, exit)
+    visited = bytearray(passable.size)
+    # The path holds each passable square at most once, plus the entrance
+    capacity = int(np.count_nonzero(passable)) + 1
+    passable = bytearray(passable.tobytes())
+
+    def to_xy(index):
+        return index % padded_cols - 1, index // padded_cols - 1
+
+    # Directions for movement: Down, Up, Right, Left
+    directions = (padded_cols, -padded_cols, 1, -1)
+
+    # Read and written through memoryviews, which index as plain Python ints
+    index_type = np.int32 if len(passable) < 2 ** 31 else np.int64
+    path_array = np.empty(capacity, dtype=index_type)
+    path = memoryview(path_array)
+    next_direction = memoryview(np.empty(capacity, dtype=np.uint8))
+    path[0] = start
+    next_direction[0] = 0
+    top = 0
+    visited[start] = 1
+    explored = 1
+    found = False
+    if observer:
+        observer.event(Event.NODE_EXPANDED)
+
+    cols = maze.shape[1]
+    if animate:
+        maze[entrance[1], entrance[0]] = 4
+        _play(screen, 'explore')
+        yield maze, None, [entrance[1] * cols + entrance[0]]
+
+    while top >= 0:
+        cell = path[top]
+        direction = next_direction[top]
+
+        if direction == 4:
+            # Every neighbour has been tried: backtrack
+            top -= 1
+            if observer:
+                observer.event(Event.BACKTRACK)
+            if animate:
+                changed = []
+                if cell != start:
+                    x, y = to_xy(cell)
+                    maze[y, x] = 0  # Mark as backtracked
+                    _play(screen, 'backtrack')
+                    changed.append(y * cols + x)
+                yield maze, None, changed
+            continue
+
+        next_direction[top] = direction + 1
+        neighbor = cell + directions[direction]
+        if not passable[neighbor] or visited[neighbor]:
+            continue
+
+        explored += 1
+        if observer:
+            observer.event(Event.NODE_EXPANDED)
+        top += 1
+        path[top] = neighbor
+        if neighbor == goal:
+            found = True  # The exit ends the path
+            break
+
+        visited[neighbor] = 1
+        next_direction[top] = 0
+
+        if animate:
+            x, y = to_xy(neighbor)
+            maze[y, x] = 4  # Mark as visited
+            _play(screen, 'explore')
+            yield maze, None, [y * cols + x]
+
+    if not found:
+        return [], explored
+
+    xs, ys = _padded_to_xy(path_array[:top + 1], padded_cols)
+    solution = list(zip(xs.tolist(), ys.tolist()))
+    yield from _mark_solution(maze, solution, exit, screen, animate)
+    return solution, explored
+
+
+def cell_moves(maze):
+    """
+    Open directions of every cell of a generate_maze() grid as a flat uint8 bitmask.
+
+    Bit d is set when the passage in direction d (Down, Up, Right, Left) is open; the
+    border is never open, so a move can never leave the maze through the entrance or exit.
+    """
+    height, width = maze.shape[0] // 2, maze.shape[1] // 2
+    passable = (maze == 0) | (maze == 3)
+    south = passable[2:-1:2, 1::2]
+    east = passable[1::2, 2:-1:2]
+    moves = np.zeros((height, width), dtype=np.uint8)
+    moves[:-1] |= south * np.uint8(1)
+    moves[1:] |= south * np.uint8(2)
+    moves[:, :-1] |= east * np.uint8(4)
+    moves[:, 1:] |= east * np.uint8(8)
+    return moves.ravel()
+
+
+def nearest_cell(x, y, width, height):
+    """Flat index of the maze cell nearest grid position (x, y); markers sit on the border."""
+    cx = min(max((x - 1) // 2, 0), width - 1)
+    cy = min(max((y - 1) // 2, 0), height - 1)
+    return cy * width + cx
+
+
+def flood_levels(moves, width, came_from, start, goal=-1):
+    """
+    Level-synchronous breadth-first flood over the cells described by cell_moves().
+
+    came_from must be an int8 array of -1 with one entry per cell; every cell reached gets
+    the direction code of the move that first reached it (4 for the start). Yields the
+    flat indices of each new level and stops once `goal` is reached (or every reachable
+    cell is flooded when goal is -1).
+    """
+    # Directions for movement: Down, Up, Right, Left
+    index_type = np.int32 if moves.size < 2 ** 31 else np.int64
+    steps = np.array((width, -width, 1, -1), dtype=index_type)
+    direction_bits = np.array((1, 2, 4, 8), dtype=np.uint8)
+
+    came_from[start] = 4
+    frontier = np.array([start], dtype=index_type)
+
+    while len(frontier) and (goal < 0 or came_from[goal] < 0):
+        sources, directions = np.nonzero(moves[frontier][:, None] & direction_bits)
+        targets = frontier[sources] + steps[directions]
+        fresh = came_from[targets] < 0
+        targets, directions = targets[fresh], directions[fresh]
+        came_from[targets] = directions
+        # With loops two cells of a level can reach the same cell; keep the one that won
+        frontier = targets[came_from[targets] == directions]
+        yield frontier
+
+
+def flood_cells(moves, width, start, goal=-1):
+    """
+    Run flood_levels() to the end.
+
+    Returns:
+        tuple: (came_from, reached) where came_from holds, per cell, the direction code of
+        the move that first reached it (-1 = unreached, 4 = start) and reached is the
+        number of cells reached.
+    """
+    came_from = np.full(moves.size, -1, dtype=np.int8)
+    reached = 1 + sum(len(level) for level in flood_levels(moves, width, came_from, start, goal))
+    return came_from, reached
+
+
+def cell_path_to_grid(cells, width):
+    """Grid (x, y) positions along a path of flat cell indices, passages included."""
+    cells = np.asarray(cells)
+    xs, ys = 2 * (cells % width) + 1, 2 * (cells // width) + 1
+    # Interleave the grid position of each cell with the passage leading to the next one
+    path_x = np.empty(2 * len(cells) - 1, dtype=np.int64)
+    path_y = np.empty_like(path_x)
+    path_x[0::2], path_x[1::2] = xs, (xs[:-1] + xs[1:]) // 2
+    path_y[0::2], path_y[1::2] = ys, (ys[:-1] + ys[1:]) // 2
+    return list(zip(path_x.tolist(), path_y.tolist()))
+
+
+@_observed
+def solve_maze_flood_fill(maze, screen=None, visualize=True, entrance=None, exit=None,
+                          observer=None):
+    """
+    Solve the maze with a breadth-first flood fill, optionally visualizing it.
+
+    The flood runs on the cells of the generate_maze() layout rather than on every grid
+    square, so each level steps through a passage to the next cell. The search is
+    level-synchronous: the whole frontier is a NumPy array of flat cell indices, and a
+    level is expanded with one gather of the cells' open-direction bits. Every reached
+    cell records the direction code of the move that reached it in a flat int8 array,
+    which is enough to walk the shortest path back from the exit. When animating, one
+    frame is drawn per level rather than per cell.
+
+    Args:
+        maze (numpy.ndarray): The maze grid where 0 = path, 1 = wall, 2 = entrance, 3 = exit.
+        screen (pygame.Surface): Pygame screen for visualization.
+        visualize (bool): Whether to visualize the process.
+        entrance (tuple): Known (x, y) of the entrance; the grid is scanned when omitted.
+        exit (tuple): Known (x, y) of the exit; the grid is scanned when omitted.
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        tuple: (path, explored) where path is the shortest list of (x, y) cells from
+        entrance to exit (empty when the exit is unreachable) and explored is the number of
+        grid cells the flood reached. None when the maze has no entrance or exit.
+    """
+    steps = solve_maze_flood_fill_steps(maze, screen, visualize, entrance, exit, observer)
+    return _run_steps(steps, screen)
+
+
+def solve_maze_flood_fill_steps(maze, screen=None, visualize=True, entrance=None, exit=None,
+                                observer=None):
+    """Step generator behind solve_maze_flood_fill(); see _run_steps()."""
+    if entrance is None or exit is None:
+        entrance, exit = find_markers(maze)
+    if not entrance or not exit:
+        print("Maze must have an entrance (2) and exit (3).")
+        return
+
+    animate = visualize and screen
+    height, width = maze.shape[0] // 2, maze.shape[1] // 2
+    start = nearest_cell(*entrance, width, height)
+    goal = nearest_cell(*exit, width, height)
+
+    if observer:
+        observer.event(Event.NODE_EXPANDED)
+    cols = maze.shape[1]
+    if animate:
+        first = (2 * (start // width) + 1) * cols + 2 * (start % width) + 1
+        maze[entrance[1], entrance[0]] = maze.flat[first] = 4
+        yield maze, None, [entrance[1] * cols + entrance[0], first]
+
+    moves = cell_moves(maze)
+    came_from = np.full(moves.size, -1, dtype=np.int8)
+    dx, dy = np.array((0, 0, 1, -1)), np.array((1, -1, 0, 0))
+    reached = 1
+    for frontier in flood_levels(moves, width, came_from, start, goal):
+        reached += len(frontier)
+        if observer:
+            # Each new cell counts with the passage it was entered through
+            observer.event(Event.NODE_EXPANDED, 2 * len(frontier))
+        if animate:
+            codes = came_from[frontier]
+            xs, ys = 2 * (frontier % width) + 1, 2 * (frontier // width) + 1
+            passages = (ys - dy[codes]) * cols + xs - dx[codes]
+            maze[ys, xs] = 4  # Mark as part of the flood-fill
+            maze.flat[passages] = 4  # ...and the passage it came through
+            _play(screen, 'explore')
+            yield maze, None, np.concatenate((ys * cols + xs, passages))
+
+    # Every reached cell but the start was entered through one passage
+    explored = 2 * reached - 1
+    if came_from[goal] < 0:
+        return [], explored
+
+    cells = trace_path(came_from, start, goal, (width, -width, 1, -1))
+    solution = [entrance] + cell_path_to_grid(cells, width) + [exit]
+
+    yield from _mark_solution(maze, solution, exit, screen, animate)
+    return solution, explored
+
+
+@_observed
+def solve_maze_astar(maze, screen=None, visualize=True, entrance=None, exit=None, observer=None):
+    """
+    Solve the maze using A* search with a Manhattan distance heuristic, optionally
+    visualizing it.
+
+    The open set is a binary heap ordered by estimated total cost, with ties broken toward
+    the cell nearer the exit. Best known costs live in a dict, so only touched cells take
+    memory, and the parent of each closed cell is a direction code in a flat bytearray.
+
+    Args:
+        maze (numpy.ndarray): The maze grid where 0 = path, 1 = wall, 2 = entrance, 3 = exit.
+        screen (pygame.Surface): Pygame screen for visualization.
+        visualize (bool): Whether to visualize the process.
+        entrance (tuple): Known (x, y) of the entrance; the grid is scanned when omitted.
+        exit (tuple): Known (x, y) of the exit; the grid is scanned when omitted.
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        tuple: (path, explored) where path is the shortest list of (x, y) cells from
+        entrance to exit (empty when the exit is unreachable) and explored is the number of
+        cells expanded. None when the maze has no entrance or exit.
+    """
+    steps = solve_maze_astar_steps(maze, screen, visualize, entrance, exit, observer)
+    return _run_steps(steps, screen)
+
+
+def solve_maze_astar_steps(maze, screen=None, visualize=True, entrance=None, exit=None,
+                           observer=None):
+    """Step generator behind solve_maze_astar(); see _run_steps()."""
+    if entrance is None or exit is None:
+        entrance, exit = find_markers(maze)
+    if not entrance or not exit:
+        print("Maze must have an entrance (2) and exit (3).")
+        return
+
+    animate = visualize and screen
+
+    passable, padded_cols, start, goal = _solver_grid(maze, entrance, exit)
+    passable = bytearray(passable.tobytes())
+    closed = bytearray(len(passable))
+    came_from = bytearray(len(passable))
+    goal_y, goal_x = divmod(goal, padded_cols)
+
+    def heuristic(index):
+        y, x = divmod(index, padded_cols)
+        return abs(x - goal_x) + abs(y - goal_y)
+
+    # Directions for movement: Down, Up, Right, Left
+    directions = (padded_cols, -padded_cols, 1, -1)
+
+    cost = {start: 0}
+    start_h = heuristic(start)
+    open_heap = [(start_h, start_h, start)]
+    explored = 0
+    found = False
+
+    while open_heap:
+        _, _, cell = heapq.heappop(open_heap)
+        if closed[cell]:
+            continue  # Stale entry left behind by a cheaper route
+        closed[cell] = 1
+        explored += 1
+        if observer:
+            observer.event(Event.NODE_EXPANDED)
+
+        if cell == goal:
+            found = True
+            break
+
+        if animate:
+            x, y = cell % padded_cols - 1, cell // padded_cols - 1
+            maze[y, x] = 4  # Mark as expanded
+            _play(screen, 'explore')
+            yield maze, None, [y * maze.shape[1] + x]
+
+        next_cost = cost[cell] + 1
+        for code, offset in enumerate(directions):
+            neighbor = cell + offset
+            if passable[neighbor] and not closed[neighbor] and next_cost < cost.get(neighbor, len(passable)):
+                cost[neighbor] = next_cost
+                came_from[neighbor] = code
+                h = heuristic(neighbor)
+                heapq.heappush(open_heap, (next_cost + h, h, neighbor))
+
+    if not found:
+        return [], explored
+
+    path = trace_path(came_from, start, goal, directions)
+    xs, ys = _padded_to_xy(np.array(path), padded_cols)
+    solution = list(zip(xs.tolist(), ys.tolist()))
+    yield from _mark_solution(maze, solution, exit, screen, animate)
+    return solution, explored
+
+
+def kruskal_tree(width, height, rng):
+    """
+    Pick the edges Kruskal's algorithm keeps when it processes the grid edges in a random order.
+
+    Ranks come from one vectorized permutation. With distinct ranks the resulting spanning
+    tree is unique, so instead of a sequential union-find it is found with Boruvka rounds
+    over NumPy arrays: each component takes its lowest-ranked outgoing edge, components
+    are hooked along those edges, and labels are flattened by repeated pointer jumping
+    (comp = comp[comp]), the array form of path halving. Every round at least halves the
+    number of components, so there are O(log n) whole-array passes.
+
+    Returns:
+        tuple: (first, second, rank) arrays of cell indices (y * width + x) and processing
+        ranks of the tree edges
+    """
+    cells = np.arange(width * height).reshape(height, width)
+    first = np.concatenate((cells[:, :-1].ravel(), cells[:-1, :].ravel()))
+    second = np.concatenate((cells[:, 1:].ravel(), cells[1:, :].ravel()))
+    rank = rng.permutation(len(first))
+    no_edge = len(rank)
+
+    # Component label of each edge's two endpoints; labels are compacted every round
+    comp_a, comp_b = first, second
+    components = width * height
+    tree = []
+    while True:
+        # Drop edges that now lie inside a component; they can never be carved
+        outgoing = comp_a != comp_b
+        first, second, rank = first[outgoing], second[outgoing], rank[outgoing]
+        comp_a, comp_b = comp_a[outgoing], comp_b[outgoing]
+        if not len(rank):
+            break
+
+        # Lowest-ranked outgoing edge of every component
+        best = np.full(components, no_edge, dtype=rank.dtype)
+        np.minimum.at(best, comp_a, rank)
+        np.minimum.at(best, comp_b, rank)
+        from_a, from_b = best[comp_a] == rank, best[comp_b] == rank
+        chosen = from_a | from_b
+        tree.append((first[chosen], second[chosen], rank[chosen]))
+
+        # Hook each component onto its neighbour across that edge; break mutual pairs
+        labels = np.arange(components)
+        parent = labels.copy()
+        parent[comp_a[from_a]] = comp_b[from_a]
+        parent[comp_b[from_b]] = comp_a[from_b]
+        mutual = (parent[parent] == labels) & (labels < parent)
+        parent[mutual] = labels[mutual]
+
+        # Flatten the hooked trees, then renumber the surviving roots 0..k-1
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+        roots = parent == labels
+        parent = (np.cumsum(roots) - 1)[parent]
+        components = int(roots.sum())
+        comp_a, comp_b = parent[comp_a], parent[comp_b]
+
+    if not tree:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+    return tuple(np.concatenate(column) for column in zip(*tree))
+
+
+@_observed
+def carve_passages_kruskal(maze, width, height, screen=None, visualize=True, rng=None, observer=None):
+    """
+    Generate a maze using randomized Kruskal's algorithm.
+
+    Headless runs pick the whole tree with kruskal_tree and carve it in one scatter.
+    When animating, the same walls are removed one at a time in the order Kruskal's
+    algorithm would have processed them.
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_kruskal_steps(maze, width, height, screen, visualize, rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_kruskal_steps(maze, width, height, screen=None, visualize=True, rng=None,
+                                 observer=None):
+    """Step generator behind carve_passages_kruskal(); see _run_steps()."""
+    cols = maze.shape[1]
+    rng = numpy_rng(resolve_rng(rng))
+    first, second, rank = kruskal_tree(width, height, rng)
+
+    # Wall is in between cells
+    walls = (_cell_to_grid(first, width, cols) + _cell_to_grid(second, width, cols)) // 2
+    if observer:
+        observer.event(Event.WALL_REMOVED, len(walls))
+
+    if visualize and screen:
+        for wall in walls[np.argsort(rank)].tolist():
+            maze.flat[wall] = 0
+            _play(screen, 'wall_carve')
+            yield maze, None, [wall]
+    else:
+        maze.flat[walls] = 0
+
+    return maze
+
+
+def eller_rows(width, height, join_probability=0.5, rng=None):
+    """
+    Generate a maze with Eller's algorithm, yielding one finished grid row at a time.
+
+    Only the current row's set labels are kept, so memory is O(width) no matter how tall
+    the maze is. Each cell row produces two grid rows: the cells with their east walls,
+    then the south walls below them. Horizontal joins go through a small union-find over
+    the row's labels; picking the downward openings (at least one per set) and relabelling
+    the next row are whole-row NumPy operations.
+
+    Args:
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        join_probability (float): Chance of joining two neighbouring cells in different
+            sets, and of a cell opening downwards
+        rng (random.Random or int): Random source or seed; None uses the random module
+
+    Yields:
+        numpy.ndarray: The 2 * height + 1 grid rows (uint8, 0 = path, 1 = wall) from top to
+        bottom, each of length 2 * width + 1
+    """
+    rng = numpy_rng(resolve_rng(rng))
+    border = np.ones(2 * width + 1, dtype=np.uint8)
+    yield border.copy()
+
+    labels = np.arange(width)
+    for y in range(height):
+        last = y == height - 1
+
+        # Join neighbouring cells in different sets; the last row joins all of them
+        parent = list(range(width))
+
+        def find(label):
+            while parent[label] != label:
+                parent[label] = label = parent[parent[label]]
+            return label
+
+        row_labels = labels.tolist()
+        joins = [True] * (width - 1) if last else (rng.random(width - 1) < join_probability).tolist()
+        east = np.zeros(width - 1, dtype=bool)
+        for x in range(width - 1):
+            if joins[x]:
+                a, b = find(row_labels[x]), find(row_labels[x + 1])
+                if a != b:
+                    parent[b] = a
+                    east[x] = True
+
+        # Resolve every label to its set root
+        roots = np.array(parent)
+        while True:
+            grand = roots[roots]
+            if np.array_equal(grand, roots):
+                break
+            roots = grand
+        labels = roots[labels]
+
+        row = np.zeros(2 * width + 1, dtype=np.uint8)
+        row[0] = row[-1] = 1
+        row[2:-1:2] = ~east
+        yield row
+
+        if last:
+            yield border.copy()
+            break
+
+        # Open cells downwards at random, then make sure every set has at least one opening
+        down = rng.random(width) < join_probability
+        has_down = np.zeros(width, dtype=bool)
+        has_down[labels[down]] = True
+        order = rng.permutation(width)
+        first_labels, first = np.unique(labels[order], return_index=True)
+        pick = order[first[~has_down[first_labels]]]
+        down[pick] = True
+
+        below = np.ones(2 * width + 1, dtype=np.uint8)
+        below[1::2] = ~down
+        yield below
+
+        # Cells without an opening above start new sets; renumber labels to 0..width-1
+        labels = np.where(down, labels, width + np.arange(width))
+        labels = np.unique(labels, return_inverse=True)[1]
+
+
+@_observed
+def carve_passages_eller(maze, width, height, screen=None, visualize=True, rng=None, observer=None):
+    """
+    Generate a maze using Eller's algorithm, filling `maze` row by row from eller_rows().
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_eller_steps(maze, width, height, screen, visualize, rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_eller_steps(maze, width, height, screen=None, visualize=True, rng=None,
+                               observer=None):
+    """Step generator behind carve_passages_eller(); see _run_steps()."""
+    cols = maze.shape[1]
+    for y, row in enumerate(eller_rows(width, height, rng=rng)):
+        maze[y] = row
+        if observer and 0 < y < 2 * height:
+            # Odd rows hold the east passages, even rows the south passages
+            passages = row[2:-1:2] if y % 2 else row[1::2]
+            observer.event(Event.WALL_REMOVED, int(np.count_nonzero(passages == 0)))
+        if visualize and screen and y % 2:
+            # This row and the south passages row written before it
+            yield maze, None, np.arange((y - 1) * cols, (y + 1) * cols)
+    return maze
+
+
+def write_maze_rows(rows, stream):
+    """
+    Stream grid rows to a binary file-like object as comma-separated 0/1 lines (the maze.csv
+    layout), one row at a time.
+
+    Args:
+        rows (iterable): Grid rows, e.g. from eller_rows()
+        stream: Object with a write(bytes) method, such as open(path, 'wb') or
+            socket.makefile('wb')
+
+    Returns:
+        int: Number of rows written
+    """
+    count = 0
+    line = None
+    for row in rows:
+        if line is None or len(line) != 2 * len(row):
+            line = np.full(2 * len(row), ord(','), dtype=np.uint8)
+            line[-1] = ord('\n')
+        line[::2] = row + ord('0')
+        stream.write(line.tobytes())
+        count += 1
+    return count
+
+
+def _carve_cell_rows(maze, north, west, screen, visualize):
+    """
+    Open the north and west passages picked for every cell, as two scatters or, when
+    animating, one cell row per step. north and west are (height, width) boolean arrays.
+    """
+    if visualize and screen:
+        cols = maze.shape[1]
+        for y in range(north.shape[0]):
+            maze[2 * y, 1::2][north[y]] = 0
+            maze[2 * y + 1, 0:-1:2][west[y]] = 0
+            _play(screen, 'wall_carve')
+            yield maze, None, np.arange(2 * y * cols, (2 * y + 2) * cols)
+    else:
+        maze[0:-1:2, 1::2][north] = 0
+        maze[1::2, 0:-1:2][west] = 0
+    return maze
+
+
+@_observed
+def carve_passages_binary_tree(maze, width, height, screen=None, visualize=True, rng=None,
+                               observer=None):
+    """
+    Generate a maze with the binary tree algorithm: every cell opens north or west.
+
+    One random draw per cell picks the direction for the whole grid at once; cells on the
+    top row can only go west and cells in the left column only north. The mazes are
+    strongly biased (the top row and left column are open corridors) but take a single
+    vectorized pass to make.
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_binary_tree_steps(maze, width, height, screen, visualize, rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_binary_tree_steps(maze, width, height, screen=None, visualize=True, rng=None,
+                                     observer=None):
+    """Step generator behind carve_passages_binary_tree(); see _run_steps()."""
+    rng = numpy_rng(resolve_rng(rng))
+    north = rng.random((height, width)) < 0.5
+    north[:, 0] = True
+    north[0] = False
+    west = ~north
+    west[:, 0] = False
+    if observer:
+        observer.event(Event.WALL_REMOVED, width * height - 1)
+    return (yield from _carve_cell_rows(maze, north, west, screen, visualize))
+
+
+@_observed
+def carve_passages_sidewinder(maze, width, height, screen=None, visualize=True, rng=None,
+                              observer=None):
+    """
+    Generate a maze with the sidewinder algorithm.
+
+    Every row is cut into runs of cells joined west to east, and one random cell of each
+    run opens north; the top row is a single run. The run boundaries are one random draw
+    per cell, runs are numbered with a cumulative sum over the flattened rows, and the
+    north openings are picked for all runs at once, so there is no per-cell Python work.
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_sidewinder_steps(maze, width, height, screen, visualize, rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_sidewinder_steps(maze, width, height, screen=None, visualize=True, rng=None,
+                                    observer=None):
+    """Step generator behind carve_passages_sidewinder(); see _run_steps()."""
+    rng = numpy_rng(resolve_rng(rng))
+    # A run starts at the left edge and wherever a cell is not joined to the one before it
+    west = rng.random((height, width)) < 0.5
+    west[0] = True
+    west[:, 0] = False
+    starts = np.flatnonzero(~west)
+    lengths = np.diff(np.append(starts, width * height))
+
+    # One random cell of each run below the top row opens north
+    chosen = starts + (rng.random(len(starts)) * lengths).astype(starts.dtype)
+    north = np.zeros(width * height, dtype=bool)
+    north[chosen[chosen >= width]] = True
+    if observer:
+        observer.event(Event.WALL_REMOVED, width * height - 1)
+    return (yield from _carve_cell_rows(maze, north.reshape(height, width), west, screen,
+                                        visualize))
+
+
+@_observed
+def carve_passages_division(maze, width, height, screen=None, visualize=True, rng=None,
+                            observer=None):
+    """
+    Generate a maze by recursive division.
+
+    The interior starts open. Each chamber is split by a wall with a single gap, across
+    its longer side (either way when square), until every chamber is one cell. The
+    chambers of one recursion level are split together with array operations, so the
+    number of Python steps is the depth of the recursion, not the number of chambers.
+
+    Once every chamber is a single cell, every square between cells has been walled
+    except the gaps. Headless runs therefore leave the grid's walls standing and only
+    open the gaps, one scatter per level. Chambers one cell wide are finished in a single
+    level, since all their gaps are known. When animating, the interior is cleared and
+    each wall is drawn as a slice assignment of its own step.
+
+    Args:
+        maze (numpy.ndarray): The initial maze grid
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        screen (pygame.Surface): Pygame screen for visualization
+        visualize (bool): Whether to visualize the generation process
+        rng (random.Random or int): Random source or seed; None uses the random module
+        observer (maze_events.Observer): Receives step events and phase timings, or None
+
+    Returns:
+        numpy.ndarray: The generated maze
+    """
+    steps = carve_passages_division_steps(maze, width, height, screen, visualize, rng, observer)
+    return _run_steps(steps, screen)
+
+
+def carve_passages_division_steps(maze, width, height, screen=None, visualize=True, rng=None,
+                                  observer=None):
+    """Step generator behind carve_passages_division(); see _run_steps()."""
+    cols = maze.shape[1]
+    rng = numpy_rng(resolve_rng(rng))
+    animate = visualize and screen
+    if animate:
+        maze[1:-1, 1:-1] = 0
+        yield maze, None, None
+    flat = maze.reshape(-1)
+
+    # Chambers in cells: left, top, width, height
+    index_type = np.int32 if maze.size < 2 ** 31 else np.int64
+    x0, y0 = np.zeros(1, dtype=index_type), np.zeros(1, dtype=index_type)
+    w, h = np.array([width], dtype=index_type), np.array([height], dtype=index_type)
+    while len(w):
+        # A chamber one cell wide is split at its only cell every time, so all of its
+        # inner boundaries end up open; retire such strips in one go
+        row, column = h == 1, w == 1
+        strip = row | column
+        if strip.any():
+            flat_row, flat_column = row[strip], column[strip]
+            sx0, sy0, length = x0[strip], y0[strip], (w + h - 2)[strip]
+            if not animate:
+                first = (2 * sy0 + 1) * cols + 2 * sx0 + 1 + np.where(flat_row, 1, cols)
+                stride = np.where(flat_row, 2, 2 * cols).astype(index_type)
+                offsets = np.arange(length.sum(), dtype=index_type) - np.repeat(
+                    np.cumsum(length, dtype=index_type) - length, length)
+                flat[np.repeat(first, length) + offsets * np.repeat(stride, length)] = 0
+            if observer:
+                observer.event(Event.WALL_REMOVED, int(length.sum()))
+            keep = ~strip
+            x0, y0, w, h = x0[keep], y0[keep], w[keep], h[keep]
+            if not len(w):
+                break
+
+        horizontal = (h > w) | ((h == w) & (rng.random(len(w)) < 0.5))
+        vertical = ~horizontal
+        across = np.where(horizontal, h, w)  # Side the wall is placed along
+        along = w + h - across               # Side the wall runs along
+        cut = 1 + (rng.random(len(w)) * (across - 1)).astype(index_type)
+        gap = (rng.random(len(w)) * along).astype(index_type)
+
+        # Each wall is a flat start index, a stride and a length of 2 * along - 1 squares
+        cut_x, cut_y = cut * vertical, cut * horizontal
+        start = (2 * (y0 + cut_y) + vertical) * cols + 2 * (x0 + cut_x) + horizontal
+        stride = np.where(horizontal, 1, cols).astype(index_type)
+        gaps = start + 2 * gap * stride
+        if observer:
+            observer.event(Event.WALL_REMOVED, len(gaps))
+
+        if animate:
+            for first, step, length, opening in zip(start.tolist(), stride.tolist(),
+                                                    (2 * along - 1).tolist(), gaps.tolist()):
+                flat[first:first + step * length:step] = 1
+                flat[opening] = 0
+                _play(screen, 'wall_carve')
+                yield maze, None, range(first, first + step * length, step)
+        else:
+            flat[gaps] = 0
+
+        # The two halves of every chamber: the first keeps the corner, the second starts
+        # at the cut
+        x0, y0, w, h = (
+            np.concatenate((x0, x0 + cut_x)),
+            np.concatenate((y0, y0 + cut_y)),
+            np.concatenate((np.where(horizontal, w, cut), w - cut_x)),
+            np.concatenate((np.where(horizontal, cut, h), h - cut_y)),
+        )
+
+    return maze
@@ -0,0 +1,83 @@
+"""
+Step events reported by the generators and solvers, and a stats collector for them.
+
+Every carve_passages_* and solve_maze_* function takes an `observer`. Left at None, the
+instrumentation costs one truth test at each reporting point. Vectorized code reports a
+whole batch in one call, so `count` can be far larger than one.
+"""
+import time
+from collections import Counter
+from enum import Enum
+
+
+class Event(Enum):
+    """Kinds of step event."""
+
+    # A cell joined the growing tree (tree-growing generators; the root is not reported)
+    CELL_CARVED = 'cell_carved'
+    # A wall between two cells was knocked down (every generator)
+    WALL_REMOVED = 'wall_removed'
+    # A loop was cut out of a loop-erased random walk; `size` is its length in cells
+    LOOP_ERASED = 'loop_erased'
+    # A solver expanded (entered) a cell
+    NODE_EXPANDED = 'node_expanded'
+    # A depth-first search stepped back out of a dead end
+    BACKTRACK = 'backtrack'
+
+
+class Observer:
+    """Base class for observers: every hook does nothing, so override only what you need."""
+
+    def event(self, kind, count=1, size=0):
+        """Called with an Event, how many happened and, for LOOP_ERASED, their size."""
+
+    def phase_started(self, name):
+        """Called when a generator or solver (named after its function) starts."""
+
+    def phase_finished(self, name):
+        """Called when the phase started with the same name returns."""
+
+
+class StatsCollector(Observer):
+    """
+    Observer that counts events and times phases.
+
+    Attributes:
+        counts (collections.Counter): Total count of each Event
+        loop_lengths (collections.Counter): Histogram of erased loop lengths, in cells
+        phase_seconds (dict): Total seconds spent in each phase, by name
+        phase_calls (collections.Counter): Number of times each phase ran
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.loop_lengths = Counter()
+        self.phase_seconds = {}
+        self.phase_calls = Counter()
+        self._started = {}
+
+    def event(self, kind, count=1, size=0):
+        self.counts[kind] += count
+        if kind is Event.LOOP_ERASED:
+            self.loop_lengths[size] += count
+
+    def phase_started(self, name):
+        self._started[name] = time.perf_counter()
+
+    def phase_finished(self, name):
+        elapsed = time.perf_counter() - self._started.pop(name)
+        self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + elapsed
+        self.phase_calls[name] += 1
+
+    def summary(self):
+        """The collected stats as a JSON-ready dict."""
+        erased = sum(length * n for length, n in self.loop_lengths.items())
+        loops = sum(self.loop_lengths.values())
+        return {
+            'counts': {kind.value: n for kind, n in self.counts.items()},
+            'loops_erased': loops,
+            'mean_loop_length': erased / loops if loops else 0.0,
+            'longest_loop': max(self.loop_lengths, default=0),
+            'phase_seconds': dict(self.phase_seconds),
+            'phase_calls': dict(self.phase_calls),
+        }
@@ -0,0 +1,247 @@
+"""
+Binary maze files.
+
+A .amz file is a fixed 64-byte header followed by the packed east and south wall bits of
+a CompactMaze. The wall bits start at a fixed offset, so open_compact() can map them with
+np.memmap and large mazes open without being read: only the pages a caller expands (for
+example one band of rows through CompactMaze.grid_rows()) are ever loaded.
+
+Header layout (little-endian):
+    magic      4s   b'AMAZ'
+    version    H    FORMAT_VERSION
+    flags      H    FLAG_SEED | FLAG_MARKERS
+    width      I    cells
+    height     I    cells
+    seed       Q    valid when FLAG_SEED is set; 0 .. MAX_SEED
+    algorithm  16s  generator name, NUL padded
+    entrance   II   (x, y), valid when FLAG_MARKERS is set
+    exit       II   (x, y), valid when FLAG_MARKERS is set
+    padding    up to HEADER_SIZE
+
+Archives (.amzt) store many perfect mazes of one size as spanning-tree edge bitstrings:
+one bit per interior wall, set when the passage is open, so each maze costs about
+width * height / 4 bytes with no header of its own.
+"""
+import numbers
+import os
+import struct
+
+import numpy as np
+
+from maze_compact import CompactMaze
+from maze_core import generate_maze
+from maze_model import Maze
+
+MAGIC = b'AMAZ'
+ARCHIVE_MAGIC = b'AMZT'
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+
+FLAG_SEED = 1
+FLAG_MARKERS = 2
+
+# Largest seed the header's unsigned 64-bit field can hold
+MAX_SEED = 2 ** 64 - 1
+
+_HEADER = struct.Struct('<4sHHIIQ16sIIII')
+_ARCHIVE_HEADER = struct.Struct('<4sHHII')
+
+
+def check_seed(seed):
+    """
+    Validate a seed that is going to be stored.
+
+    Returns:
+        int: The seed as a plain int, or None when `seed` is None.
+
+    Raises:
+        ValueError: When the seed is not an integer from 0 to MAX_SEED.
+    """
+    if seed is None:
+        return None
+    if not isinstance(seed, numbers.Integral) or not 0 <= seed <= MAX_SEED:
+        raise ValueError(f"seed must be an integer from 0 to {MAX_SEED}, got {seed!r}")
+    return int(seed)
+
+
+def save_maze(path, maze):
+    """
+    Write a Maze to `path` in the .amz format.
+
+    Solver marks (2-5) in the grid are not stored; the entrance and exit go in the header.
+    """
+    flags = 0
+    seed = 0
+    if maze.seed is not None:
+        flags |= FLAG_SEED
+        seed = check_seed(maze.seed)
+    entrance = exit = (0, 0)
+    if maze.entrance and maze.exit:
+        flags |= FLAG_MARKERS
+        entrance, exit = maze.entrance, maze.exit
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, maze.width, maze.height, seed,
+                          (maze.algorithm or '').encode('ascii'), *entrance, *exit)
+    compact = CompactMaze.from_grid(maze.grid)
+    with open(path, 'wb') as f:
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        f.write(compact.east.tobytes())
+        f.write(compact.south.tobytes())
+
+
+def read_header(path):
+    """
+    Read the header of a .amz file.
+
+    Returns:
+        dict: version, width, height, algorithm, seed, entrance and exit (None when not
+        stored).
+
+    Raises:
+        ValueError: If the file is not a .amz file or was written by a newer version.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE or raw[:4] != MAGIC:
+        raise ValueError(f"{path} is not a maze file")
+
+    (_, version, flags, width, height, seed, algorithm,
+     entrance_x, entrance_y, exit_x, exit_y) = _HEADER.unpack_from(raw)
+    if version > FORMAT_VERSION:
+        raise ValueError(f"{path} uses maze format version {version}; "
+                         f"this reader supports up to {FORMAT_VERSION}")
+
+    markers = flags & FLAG_MARKERS
+    return {
+        'version': version,
+        'width': width,
+        'height': height,
+        'algorithm': algorithm.rstrip(b'\0').decode('ascii') or None,
+        'seed': seed if flags & FLAG_SEED else None,
+        'entrance': (entrance_x, entrance_y) if markers else None,
+        'exit': (exit_x, exit_y) if markers else None,
+    }
+
+
+def open_compact(path, mode='r'):
+    """
+    Map a .amz file without reading its wall bits.
+
+    Returns:
+        tuple: (header, CompactMaze) where the CompactMaze's east and south arrays are
+        views into one np.memmap of the file.
+
+    Raises:
+        ValueError: If the file is not a .amz file, was written by a newer version or is
+        shorter than its header says.
+    """
+    header = read_header(path)
+    width, height = header['width'], header['height']
+    expected = HEADER_SIZE + 2 * height * ((width + 7) // 8)
+    size = os.path.getsize(path)
+    if size < expected:
+        raise ValueError(f"{path} is truncated: a {width}x{height} maze needs {expected} "
+                         f"bytes, the file has {size}")
+    walls = np.memmap(path, dtype=np.uint8, mode=mode, offset=HEADER_SIZE,
+                      shape=(2, height, (width + 7) // 8))
+    return header, CompactMaze(width, height, walls[0], walls[1])
+
+
+def load_maze(path):
+    """Load a .amz file as a Maze, expanding the wall bits to a full grid."""
+    header, compact = open_compact(path)
+    grid = compact.to_grid()
+    entrance, exit = header['entrance'], header['exit']
+    if entrance and exit:
+        grid[entrance[1], entrance[0]] = 2
+        grid[exit[1], exit[0]] = 3
+    return Maze(grid, header['algorithm'], header['seed'], entrance, exit)
+
+
+def tree_bits(grid):
+    """
+    Encode a grid's interior passages as an edge bitstring.
+
+    The east passages of every row (width - 1 per row) come first, then the south passages
+    of every row but the last (width per row); a set bit is an open passage.
+
+    Returns:
+        bytes: ceil(((width - 1) * height + width * (height - 1)) / 8) bytes.
+    """
+    east = grid[1:-1:2, 2:-1:2] != 1
+    south = grid[2:-1:2, 1:-1:2] != 1
+    return np.packbits(np.concatenate((east.ravel(), south.ravel()))).tobytes()
+
+
+def grid_from_tree_bits(data, width, height):
+    """Rebuild the 0/1 grid from tree_bits() output."""
+    east_count = (width - 1) * height
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8),
+                         count=east_count + width * (height - 1)).astype(bool)
+    grid = generate_maze(width, height)
+    grid[1:-1:2, 2:-1:2] = ~bits[:east_count].reshape(height, width - 1)
+    grid[2:-1:2, 1:-1:2] = ~bits[east_count:].reshape(height - 1, width)
+    return grid
+
+
+def _tree_record_size(width, height):
+    return ((width - 1) * height + width * (height - 1) + 7) // 8
+
+
+def save_archive(path, grids, width, height):
+    """
+    Write mazes of one size to a .amzt archive as fixed-size tree bitstrings.
+
+    Args:
+        path (str): Output file
+        grids (iterable): Grids of width x height cells; consumed one at a time
+        width (int): Width of every maze in cells
+        height (int): Height of every maze in cells
+
+    Returns:
+        int: The number of mazes written.
+    """
+    return save_archive_records(path, (tree_bits(grid) for grid in grids), width, height)
+
+
+def save_archive_records(path, records, width, height):
+    """Like save_archive(), for records already encoded with tree_bits() (e.g. by workers)."""
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(_ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, FORMAT_VERSION, 0, width, height))
+        for record in records:
+            f.write(record)
+            count += 1
+    return count
+
+
+def open_archive(path):
+    """
+    Map a .amzt archive.
+
+    Returns:
+        tuple: (width, height, records) where records is a read-only (count, record_size)
+        np.memmap; pass a row to grid_from_tree_bits() to rebuild that maze.
+
+    Raises:
+        ValueError: If the file is not an archive, was written by a newer version or ends
+        part-way through a record.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read(_ARCHIVE_HEADER.size)
+    if len(raw) < _ARCHIVE_HEADER.size or raw[:4] != ARCHIVE_MAGIC:
+        raise ValueError(f"{path} is not a maze archive")
+    _, version, _, width, height = _ARCHIVE_HEADER.unpack(raw)
+    if version > FORMAT_VERSION:
+        raise ValueError(f"{path} uses archive format version {version}; "
+                         f"this reader supports up to {FORMAT_VERSION}")
+
+    record_size = _tree_record_size(width, height)
+    data_size = os.path.getsize(path) - _ARCHIVE_HEADER.size
+    if record_size and data_size % record_size:
+        raise ValueError(f"{path} is truncated: {data_size} bytes of records is not a "
+                         f"multiple of the {record_size}-byte record size")
+    if not data_size:
+        return width, height, np.empty((0, record_size), dtype=np.uint8)  # mmap rejects empty maps
+    records = np.memmap(path, dtype=np.uint8, mode='r', offset=_ARCHIVE_HEADER.size)
+    return width, height, records.reshape(-1, record_size)
@@ -0,0 +1,216 @@
+"""
+Minecraft datapack export.
+
+Writes a maze as a datapack whose build function places the whole maze with `fill`
+commands, instead of growing it in game from marker entities like the mazegen datapack:
+
+    python maze_minecraft.py --algorithm kruskal --width 500 --height 500 --seed 1 \\
+        --output maze_pack
+
+Copy the output directory into a world's `datapacks` folder, `/reload`, then stand at the
+maze's north-west corner and run `/function mazebuild:build`. Grid x runs east (+x) and
+grid y runs south (+z).
+
+Wall squares are merged into rectangles first. Fills may overlap, so every maximal
+horizontal and vertical run of wall is kept whole, and runs with the same span in
+consecutive rows or columns are merged. Every rectangle is then split to stay within
+MAX_FILL_VOLUME blocks. The commands are spread over part functions of at most
+`commands_per_function` lines, and `functions_per_tick` parts run each tick:
+    tick 0     mark the origin with a marker entity and forceload the area
+    tick 1..   clear, lay the floor, build the walls
+    last tick  colour the entrance and exit, unload the area and remove the marker
+Scheduled functions run at the world spawn, so every part is run `at` the origin marker
+to keep the coordinates relative to where the build was started.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+
+from maze_core import find_markers
+from maze_model import GENERATORS, Maze
+from maze_runs import long_runs, runs, stack_runs
+
+# Largest number of blocks a single fill command may change
+MAX_FILL_VOLUME = 32768
+
+# Side in blocks of the squares forceloaded one command at a time; 240 blocks touch at most
+# 16 chunks along each axis wherever they start, within the game's 256-chunk limit
+FORCELOAD_SPAN = 240
+
+PACK_FORMAT = 7
+
+WALL_BLOCK = 'minecraft:black_concrete'
+FLOOR_BLOCK = 'minecraft:white_concrete'
+ENTRANCE_BLOCK = 'minecraft:lime_concrete'
+EXIT_BLOCK = 'minecraft:red_concrete'
+
+
+def wall_rectangles(grid):
+    """
+    Cover every wall square (1) of a grid with rectangles, possibly overlapping.
+
+    Horizontal runs of two or more squares are kept, plus every vertical run holding a
+    square that no such horizontal run covers, so a straight wall is always one rectangle
+    however many other walls cross it.
+
+    Returns:
+        numpy.ndarray: (n, 4) array of inclusive (x0, y0, x1, y1) grid rectangles.
+    """
+    walls = grid == 1
+    rows, starts, ends, covered = long_runs(walls)
+    horizontal = stack_runs(rows, starts, ends)
+
+    columns, top, bottom = runs(walls.T)
+    # Keep a vertical run when any of its squares is left uncovered
+    uncovered = np.concatenate(([0], np.cumsum((walls & ~covered).T.ravel())))
+    flat_top = columns * walls.shape[0] + top
+    flat_bottom = columns * walls.shape[0] + bottom
+    needed = uncovered[flat_bottom + 1] > uncovered[flat_top]
+    vertical = stack_runs(columns[needed], top[needed], bottom[needed])
+
+    return np.concatenate((
+        horizontal[:, [1, 0, 3, 2]],  # (y0, x0, y1, x1) -> (x0, y0, x1, y1)
+        vertical,                     # (x0, y0, x1, y1) already
+    ))
+
+
+def _boxes(x0, z0, x1, z1, depth):
+    """Split an inclusive x/z rectangle into pieces that fill at most MAX_FILL_VOLUME blocks."""
+    step_x = min(x1 - x0 + 1, max(1, MAX_FILL_VOLUME // depth))
+    step_z = min(z1 - z0 + 1, max(1, MAX_FILL_VOLUME // (depth * step_x)))
+    for z in range(z0, z1 + 1, step_z):
+        for x in range(x0, x1 + 1, step_x):
+            yield x, z, min(x + step_x - 1, x1), min(z + step_z - 1, z1)
+
+
+def _fill(x0, z0, x1, z1, bottom, top, block):
+    return [f"fill ~{x} ~{bottom} ~{z} ~{x_end} ~{top} ~{z_end} {block}"
+            for x, z, x_end, z_end in _boxes(x0, z0, x1, z1, top - bottom + 1)]
+
+
+def build_commands(grid, wall_height=3, entrance=None, exit=None):
+    """
+    The fill commands that build a grid, relative to its north-west corner at floor level.
+
+    The area is cleared to air first and floored, so a maze can be rebuilt in place over
+    an older one. The entrance and exit are read from the 2 and 3 in the grid unless they
+    are given, as they must be once a solver has painted over them.
+
+    Returns:
+        list: Command strings without leading slashes.
+    """
+    rows, cols = grid.shape
+    top = wall_height - 1
+    commands = _fill(0, 0, cols - 1, rows - 1, 0, top, 'minecraft:air')
+    commands += _fill(0, 0, cols - 1, rows - 1, -1, -1, FLOOR_BLOCK)
+    for x0, z0, x1, z1 in wall_rectangles(grid).tolist():
+        commands += _fill(x0, z0, x1, z1, 0, top, WALL_BLOCK)
+    if entrance is None or exit is None:
+        entrance, exit = find_markers(grid)
+    for position, block in ((entrance, ENTRANCE_BLOCK), (exit, EXIT_BLOCK)):
+        if position:
+            x, z = position
+            commands.append(f"setblock ~{x} ~-1 ~{z} {block}")
+    return commands
+
+
+def _forceload(action, cols, rows):
+    """forceload commands covering the grid area, in pieces the game accepts."""
+    return [f"forceload {action} ~{x} ~{z} ~{min(x + FORCELOAD_SPAN, cols) - 1} "
+            f"~{min(z + FORCELOAD_SPAN, rows) - 1}"
+            for z in range(0, rows, FORCELOAD_SPAN) for x in range(0, cols, FORCELOAD_SPAN)]
+
+
+def _write_function(path, lines):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def export_datapack(grid, directory, namespace='mazebuild', wall_height=3,
+                    commands_per_function=1024, functions_per_tick=8, entrance=None, exit=None):
+    """
+    Write a datapack that builds `grid` with `/function <namespace>:build`.
+
+    Args:
+        grid (numpy.ndarray): Maze grid; 1 is wall, anything else is open floor
+        directory (str): Datapack directory to create (an older build in it is replaced)
+        namespace (str): Datapack namespace of the functions
+        wall_height (int): Wall height in blocks
+        commands_per_function (int): Most commands in one part function
+        functions_per_tick (int): Part functions run per game tick
+        entrance (tuple): (x, y) of the entrance, coloured on the floor; read from the 2
+            in the grid when omitted
+        exit (tuple): (x, y) of the exit; read from the 3 in the grid when omitted
+
+    Returns:
+        dict: Number of commands, part functions and ticks the build takes.
+    """
+    rows, cols = grid.shape
+    commands = build_commands(grid, wall_height, entrance, exit)
+    parts = [commands[i:i + commands_per_function]
+             for i in range(0, len(commands), commands_per_function)]
+    ticks = [range(i, min(i + functions_per_tick, len(parts)))
+             for i in range(0, len(parts), functions_per_tick)]
+
+    functions = os.path.join(directory, 'data', namespace, 'functions')
+    shutil.rmtree(os.path.join(functions, 'build'), ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, 'pack.mcmeta'), 'w') as f:
+        json.dump({'pack': {'pack_format': PACK_FORMAT,
+                            'description': f"Maze built with fill commands ({namespace})"}},
+                  f, indent=4)
+
+    origin = f"@e[type=minecraft:marker,tag={namespace}_origin,limit=1]"
+    _write_function(os.path.join(functions, 'build.mcfunction'), [
+        f"kill @e[type=minecraft:marker,tag={namespace}_origin]",
+        f"execute align xyz run summon minecraft:marker ~ ~ ~ {{Tags:[\"{namespace}_origin\"]}}",
+        *(f"execute at {origin} run {command}" for command in _forceload('add', cols, rows)),
+        f"schedule function {namespace}:build/tick_1 1t",
+    ])
+    for number, tick in enumerate(ticks, 1):
+        _write_function(os.path.join(functions, 'build', f'tick_{number}.mcfunction'), [
+            *(f"execute at {origin} run function {namespace}:build/part_{part}" for part in tick),
+            f"schedule function {namespace}:build/"
+            + (f"tick_{number + 1}" if number < len(ticks) else 'finish') + " 1t",
+        ])
+    for number, part in enumerate(parts):
+        _write_function(os.path.join(functions, 'build', f'part_{number}.mcfunction'), part)
+    _write_function(os.path.join(functions, 'build', 'finish.mcfunction'), [
+        *(f"execute at {origin} run {command}" for command in _forceload('remove', cols, rows)),
+        f"kill {origin}",
+        f"tellraw @a {{\"text\":\"Maze built: {cols}x{rows} blocks\",\"color\":\"green\"}}",
+    ])
+    return {'commands': len(commands), 'functions': len(parts), 'ticks': len(ticks)}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export a maze as a Minecraft datapack.")
+    parser.add_argument('--algorithm', choices=sorted(GENERATORS), default='kruskal')
+    parser.add_argument('--width', type=int, default=50, help="maze width in cells")
+    parser.add_argument('--height', type=int, default=50, help="maze height in cells")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--output', default='maze_datapack', help="datapack directory")
+    parser.add_argument('--namespace', default='mazebuild')
+    parser.add_argument('--wall-height', type=int, default=3, help="wall height in blocks")
+    parser.add_argument('--commands-per-function', type=int, default=1024)
+    parser.add_argument('--functions-per-tick', type=int, default=8)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    maze = Maze.generate(args.width, args.height, args.algorithm, seed=args.seed)
+    stats = export_datapack(maze.grid, args.output, args.namespace, args.wall_height,
+                            args.commands_per_function, args.functions_per_tick,
+                            maze.entrance, maze.exit)
+    print(f"{stats['commands']} commands in {stats['functions']} functions, built over "
+          f"{stats['ticks']} ticks -> {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Maze object model: a grid together with the metadata that solvers, renderers and
+exporters would otherwise have to rediscover by scanning it.
+"""
+import numpy as np
+
+from maze_core import (
+    generate_maze,
+    carve_passages_wilson,
+    carve_passages_prim,
+    carve_passages_aldous,
+    carve_passages_dfs,
+    carve_passages_kruskal,
+    carve_passages_eller,
+    carve_passages_binary_tree,
+    carve_passages_sidewinder,
+    carve_passages_division,
+    carve_passages_wilson_steps,
+    carve_passages_prim_steps,
+    carve_passages_aldous_steps,
+    carve_passages_dfs_steps,
+    carve_passages_kruskal_steps,
+    carve_passages_eller_steps,
+    carve_passages_binary_tree_steps,
+    carve_passages_sidewinder_steps,
+    carve_passages_division_steps,
+    add_maze_entrance_and_exit,
+    entrance_and_exit,
+    solve_maze_dfs,
+    solve_maze_flood_fill,
+    solve_maze_astar,
+    solve_maze_dfs_steps,
+    solve_maze_flood_fill_steps,
+    solve_maze_astar_steps,
+    find_markers,
+    cell_moves,
+    flood_cells,
+    nearest_cell,
+    trace_path,
+    cell_path_to_grid,
+)
+
+# Generators and solvers by the names stored in Maze.algorithm and accepted by Maze.solve()
+GENERATORS = {
+    'wilson': carve_passages_wilson,
+    'prim': carve_passages_prim,
+    'dfs': carve_passages_dfs,
+    'aldous': carve_passages_aldous,
+    'kruskal': carve_passages_kruskal,
+    'eller': carve_passages_eller,
+    'binary_tree': carve_passages_binary_tree,
+    'sidewinder': carve_passages_sidewinder,
+    'division': carve_passages_division,
+}
+
+SOLVERS = {
+    'dfs': solve_maze_dfs,
+    'flood_fill': solve_maze_flood_fill,
+    'astar': solve_maze_astar,
+}
+
+# The step generators behind them (see maze_core._run_steps), by the same names
+GENERATOR_STEPS = {
+    'wilson': carve_passages_wilson_steps,
+    'prim': carve_passages_prim_steps,
+    'dfs': carve_passages_dfs_steps,
+    'aldous': carve_passages_aldous_steps,
+    'kruskal': carve_passages_kruskal_steps,
+    'eller': carve_passages_eller_steps,
+    'binary_tree': carve_passages_binary_tree_steps,
+    'sidewinder': carve_passages_sidewinder_steps,
+    'division': carve_passages_division_steps,
+}
+
+SOLVER_STEPS = {
+    'dfs': solve_maze_dfs_steps,
+    'flood_fill': solve_maze_flood_fill_steps,
+    'astar': solve_maze_astar_steps,
+}
+
+
+class Maze:
+    """
+    A maze grid plus cached metadata.
+
+    Attributes:
+        grid (numpy.ndarray): (2h+1)x(2w+1) grid where 0 = path, 1 = wall, 2 = entrance,
+            3 = exit
+        width (int): Width of the maze in cells
+        height (int): Height of the maze in cells
+        algorithm (str): Key of the generator in GENERATORS, or None when unknown
+        seed (int): Seed the maze was generated from, or None when unknown
+        entrance (tuple): (x, y) grid position of the entrance, or None
+        exit (tuple): (x, y) grid position of the exit, or None
+    """
+
+    def __init__(self, grid, algorithm=None, seed=None, entrance=None, exit=None, tree=None):
+        self.grid = grid
+        self.height, self.width = grid.shape[0] // 2, grid.shape[1] // 2
+        self.algorithm = algorithm
+        self.seed = seed
+        if entrance is None or exit is None:
+            # Wrapping a grid of unknown origin: scan for the markers once, here
+            entrance, exit = find_markers(grid)
+        self.entrance = entrance
+        self.exit = exit
+        self._tree = tree
+
+    @classmethod
+    def generate(cls, width, height, algorithm='kruskal', seed=None, screen=None, visualize=False,
+                 observer=None):
+        """
+        Carve a new maze with one of the GENERATORS and open its entrance and exit.
+
+        Args:
+            width (int): Width of the maze in cells
+            height (int): Height of the maze in cells
+            algorithm (str): Key into GENERATORS
+            seed (int): Seed for the generator, or None to draw from the random module
+            screen (pygame.Surface): Pygame screen for visualization
+            visualize (bool): Whether to visualize the process
+            observer (maze_events.Observer): Receives step events and phase timings, or None
+        """
+        grid = GENERATORS[algorithm](generate_maze(width, height), width, height,
+                                     screen=screen, visualize=visualize, rng=seed, observer=observer)
+        add_maze_entrance_and_exit(grid)
+        entrance, exit = entrance_and_exit(grid)
+        return cls(grid, algorithm, seed, entrance, exit)
+
+    @property
+    def tree(self):
+        """
+        Spanning-tree parent links rooted at the cell next to the entrance.
+
+        A flat int8 array with one entry per cell (index y * width + x) holding the
+        direction code (0 Down, 1 Up, 2 Right, 3 Left) of the move from the parent into the
+        cell; 4 marks the root and -1 a cell that cannot be reached. Unless one was
+        supplied, it is flooded from the grid on first use and then cached.
+        """
+        if self._tree is None:
+            root = nearest_cell(*self.entrance, self.width, self.height)
+            self._tree, _ = flood_cells(cell_moves(self.grid), self.width, root)
+        return self._tree
+
+    def parents(self):
+        """Flat index of every cell's parent in the spanning tree (the cell itself for the root)."""
+        steps = np.array((self.width, -self.width, 1, -1, 0))
+        # Unreachable cells (-1) pick up the trailing 0 step as well
+        return np.arange(self.tree.size) - steps[self.tree]
+
+    def solution(self):
+        """
+        The (x, y) path from entrance to exit read off the cached spanning tree, without
+        searching or marking the grid. Empty when the exit cannot be reached.
+        """
+        root = nearest_cell(*self.entrance, self.width, self.height)
+        goal = nearest_cell(*self.exit, self.width, self.height)
+        if self.tree[goal] < 0:
+            return []
+        cells = trace_path(self.tree, root, goal, (self.width, -self.width, 1, -1))
+        return [self.entrance] + cell_path_to_grid(cells, self.width) + [self.exit]
+
+    def solve(self, solver='flood_fill', screen=None, visualize=True, observer=None):
+        """
+        Run one of the SOLVERS on the grid with the cached entrance and exit.
+
+        Returns:
+            tuple: (path, explored) as returned by the solver.
+        """
+        return SOLVERS[solver](self.grid, screen, visualize, entrance=self.entrance, exit=self.exit,
+                               observer=observer)
@@ -0,0 +1,366 @@
+"""
+Recorded animations.
+
+An algorithm run can be recorded as a compact event log (.amzr) and played back later at
+any speed, or rendered to PNG frames offline, without running the algorithm again:
+
+    python maze_record.py record run.amzr --algorithm wilson --width 200 --height 200 --seed 1
+    python maze_record.py replay run.amzr
+    python maze_record.py export run.amzr frames/ --every 10 --cell-size 4
+
+Each step is stored as the grid squares it changed: flat indices into the grid together
+with their new values, so carving (-> 0), erasing (-> 1), visiting (-> 4) and marking
+the solution (-> 5) all share one encoding. The steps are split into segments of
+`keyframe_interval` steps, each opening with a keyframe (the full grid before its first
+step) and zlib-compressed on its own, so a reader can start at any segment without
+replaying the ones before it. That is what lets export split the frames across worker
+processes.
+
+File layout (little-endian):
+    header     64 bytes: magic b'AMZR', version, flags (FLAG_SEED), grid rows and
+               columns, step count, keyframe interval, segment count, seed, algorithm
+               name and the offset of the segment index
+    segments   zlib(keyframe + step records), one after the other
+    index      Q per segment: its offset in the file
+
+Step record: I change count, i highlighted square (flat index, -1 for none), then the
+changed squares as I indices followed by B values.
+
+Recording and reading need only NumPy; replay and export load pygame through maze_view.
+"""
+import argparse
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from maze_core import OFFSCREEN, generate_maze, add_maze_entrance_and_exit, entrance_and_exit
+from maze_io import MAX_SEED, check_seed
+from maze_model import GENERATORS, GENERATOR_STEPS, SOLVERS, SOLVER_STEPS
+
+MAGIC = b'AMZR'
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+
+FLAG_SEED = 1
+
+# Keyframe bytes allowed per step by the default keyframe interval, which keeps keyframes
+# from outgrowing the steps on large grids
+KEYFRAME_BYTES_PER_STEP = 16
+
+_HEADER = struct.Struct('<4sHHIIIIIQ16sQ')
+_STEP = struct.Struct('<Ii')
+
+
+def run_steps(algorithm, width, height, seed=None, solver=None):
+    """
+    Step generator for a whole run: generate, open the entrance and exit, then optionally
+    solve. Yields the same (frame, current_cell, changed) steps as maze_core's *_steps
+    generators and returns the finished grid.
+    """
+    grid = generate_maze(width, height)
+    grid = yield from GENERATOR_STEPS[algorithm](grid, width, height, OFFSCREEN, True, rng=seed)
+    add_maze_entrance_and_exit(grid)
+    yield grid, None, None
+    if solver:
+        entrance, exit = entrance_and_exit(grid)
+        yield from SOLVER_STEPS[solver](grid, OFFSCREEN, True, entrance, exit)
+    return grid
+
+
+def record_steps(path, steps, start, algorithm=None, seed=None, keyframe_interval=None):
+    """
+    Drive a step generator to the end, writing each step to an event log.
+
+    Only the squares a step reports as changed are compared with the grid recorded so far,
+    so recording costs about as much as the changes themselves. A step that reports None,
+    or that shows a different frame array from the step before, is compared in full. When
+    the generator finishes, one more step records anything it wrote after its last step.
+
+    The log is written to `path` + '.part' and renamed to `path` once it is complete, so an
+    interrupted recording never leaves a log without its header.
+
+    Args:
+        path (str): Output .amzr file
+        steps (generator): Step generator, animating offscreen (see run_steps())
+        start (numpy.ndarray): The grid as it was before the first step
+        algorithm (str): Name stored in the header, or None
+        seed (int): Seed stored in the header, or None
+        keyframe_interval (int): Steps per segment; None picks at least 1024, enough
+            that keyframes cost KEYFRAME_BYTES_PER_STEP bytes per step
+
+    Returns:
+        The generator's result.
+
+    Raises:
+        ValueError: When the seed does not fit the header (see maze_io.check_seed()).
+    """
+    seed = check_seed(seed)
+    shown = np.array(start, dtype=np.uint8, copy=True)
+    rows, cols = shown.shape
+    if keyframe_interval is None:
+        keyframe_interval = max(1024, shown.size // KEYFRAME_BYTES_PER_STEP)
+    offsets = []
+    records = []
+    count = 0
+    partial = path + '.part'
+
+    try:
+        with open(partial, 'wb') as f:
+            f.write(b'\0' * HEADER_SIZE)
+
+            def flush():
+                offsets.append(f.tell())
+                f.write(zlib.compress(b''.join(records)))
+                records.clear()
+
+            def record(frame, changed, highlight):
+                nonlocal count
+                if count % keyframe_interval == 0:
+                    if count:
+                        flush()
+                    records.append(shown.tobytes())
+                changed = changed.astype(np.uint32)
+                values = frame.flat[changed].astype(np.uint8)
+                shown.flat[changed] = values
+                records.append(_STEP.pack(len(changed), highlight) + changed.tobytes()
+                               + values.tobytes())
+                count += 1
+
+            previous = None
+            try:
+                while True:
+                    frame, current_cell, changed = next(steps)
+                    if changed is None or frame is not previous:
+                        changed = np.flatnonzero(frame != shown)
+                    else:
+                        changed = np.unique(np.asarray(changed, dtype=np.int64))
+                        changed = changed[frame.flat[changed] != shown.flat[changed]]
+                    previous = frame
+                    highlight = current_cell[1] * cols + current_cell[0] if current_cell else -1
+                    record(frame, changed, highlight)
+            except StopIteration as done:
+                result = done.value
+            if previous is not None:
+                changed = np.flatnonzero(previous != shown)
+                if len(changed):
+                    record(previous, changed, -1)
+            if records:
+                flush()
+
+            index_offset = f.tell()
+            f.write(np.array(offsets, dtype='<u8').tobytes())
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, FLAG_SEED if seed is not None else 0,
+                                 rows, cols, count, keyframe_interval, len(offsets), seed or 0,
+                                 (algorithm or '').encode('ascii'), index_offset))
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, path)
+    return result
+
+
+def record_run(path, algorithm, width, height, seed=None, solver=None, keyframe_interval=None):
+    """Record run_steps() to `path`; returns the finished grid."""
+    steps = run_steps(algorithm, width, height, seed, solver)
+    return record_steps(path, steps, generate_maze(width, height), algorithm, seed,
+                        keyframe_interval)
+
+
+class EventLog:
+    """
+    Reader for a .amzr event log. Only the header and segment index are read up front;
+    segments are read and decompressed as they are needed.
+
+    Attributes:
+        rows (int): Grid rows
+        cols (int): Grid columns
+        steps (int): Number of recorded steps
+        keyframe_interval (int): Steps per segment
+        algorithm (str): Recorded generator name, or None
+        seed (int): Recorded seed, or None
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER_SIZE)
+            if len(raw) < HEADER_SIZE or raw[:4] != MAGIC:
+                raise ValueError(f"{path} is not a maze event log")
+            (_, version, flags, self.rows, self.cols, self.steps, self.keyframe_interval,
+             segments, seed, algorithm, index_offset) = _HEADER.unpack_from(raw)
+            if version > FORMAT_VERSION:
+                raise ValueError(f"{path} uses event log version {version}; "
+                                 f"this reader supports up to {FORMAT_VERSION}")
+            f.seek(index_offset)
+            self._offsets = np.frombuffer(f.read(8 * segments), dtype='<u8').tolist()
+        self._offsets.append(index_offset)
+        self.algorithm = algorithm.rstrip(b'\0').decode('ascii') or None
+        self.seed = seed if flags & FLAG_SEED else None
+
+    def _segment(self, index):
+        """Return the keyframe of segment `index` and a generator over its step records."""
+        start, end = self._offsets[index], self._offsets[index + 1]
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            data = zlib.decompress(f.read(end - start))
+        size = self.rows * self.cols
+        keyframe = np.frombuffer(data, dtype=np.uint8, count=size).reshape(self.rows, self.cols)
+
+        def records():
+            offset = size
+            while offset < len(data):
+                count, highlight = _STEP.unpack_from(data, offset)
+                offset += _STEP.size
+                indices = np.frombuffer(data, dtype=np.uint32, count=count, offset=offset)
+                offset += 4 * count
+                values = np.frombuffer(data, dtype=np.uint8, count=count, offset=offset)
+                offset += count
+                yield indices, values, highlight
+
+        return keyframe, records()
+
+    def frames(self, start=0, stop=None):
+        """
+        Yield (frame, current_cell) as of the end of each step in [start, stop).
+
+        The state is rebuilt from the keyframe at or before `start`. The frame array is
+        updated in place, so copy it to keep it past the next step.
+        """
+        stop = self.steps if stop is None else min(stop, self.steps)
+        step = start - start % self.keyframe_interval
+        frame = None
+        while step < stop:
+            keyframe, records = self._segment(step // self.keyframe_interval)
+            if frame is None:
+                frame = keyframe.copy()
+            for indices, values, highlight in records:
+                frame.flat[indices] = values
+                if step >= start:
+                    current_cell = divmod(highlight, self.cols)[::-1] if highlight >= 0 else None
+                    yield frame, current_cell
+                step += 1
+                if step >= stop:
+                    break
+
+    def steps_for_replay(self):
+        """The log as a step generator that maze_view.play_steps() can drive."""
+        for frame, current_cell in self.frames():
+            yield frame, current_cell, None
+
+
+def _export_frames(args):
+    """Worker: render the wanted steps of one segment to PNG files."""
+    path, start, stop, wanted, directory, cell_size = args
+    import pygame
+    from maze_view import frame_surface
+
+    written = 0
+    for step, (frame, current_cell) in enumerate(EventLog(path).frames(start, stop), start):
+        if step in wanted:
+            surface = frame_surface(frame, cell_size, current_cell)
+            pygame.image.save(surface, os.path.join(directory, f'frame_{step:07d}.png'))
+            written += 1
+    return written
+
+
+def export_frames(path, directory, every=1, cell_size=4, workers=None):
+    """
+    Render every `every`-th step of an event log (and the last one) to PNG files named
+    frame_<step>.png, one task per segment across a process pool.
+
+    Returns:
+        int: The number of frames written.
+    """
+    log = EventLog(path)
+    os.makedirs(directory, exist_ok=True)
+    wanted = set(range(every - 1, log.steps, every)) | {log.steps - 1}
+    interval = log.keyframe_interval
+    tasks = []
+    for start in range(0, log.steps, interval):
+        stop = min(start + interval, log.steps)
+        steps = {step for step in wanted if start <= step < stop}
+        if steps:
+            tasks.append((path, min(steps), max(steps) + 1, steps, directory, cell_size))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(_export_frames, tasks))
+
+
+def replay(path, cell_size=None):
+    """Play an event log back in a pygame window until it is closed."""
+    import pygame
+    import maze_view
+
+    log = EventLog(path)
+    if cell_size is None:
+        cell_size = max(1, min(maze_view.CELL_SIZE, 1000 // max(log.rows, log.cols)))
+    maze_view.init_display()
+    screen = maze_view.set_mode((log.cols * cell_size, log.rows * cell_size))
+    pygame.display.set_caption(f"Replay: {log.algorithm or path}")
+    maze_view.get_renderer(screen).cell_size = cell_size
+    print("Animation speed: + faster, - slower, 0 as fast as possible")
+    maze_view.play_steps(screen, log.steps_for_replay())
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        pygame.time.Clock().tick(maze_view.FPS)
+    pygame.quit()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Record, replay and export maze animations.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record = commands.add_parser('record', help="run an algorithm and record its steps")
+    record.add_argument('log', help="output .amzr file")
+    record.add_argument('--algorithm', choices=sorted(GENERATORS), default='wilson')
+    record.add_argument('--width', type=int, default=50, help="maze width in cells")
+    record.add_argument('--height', type=int, default=50, help="maze height in cells")
+    record.add_argument('--seed', type=int, help=f"0 to {MAX_SEED}")
+    record.add_argument('--solve', choices=sorted(SOLVERS), help="also record this solver")
+    record.add_argument('--keyframe-interval', type=int,
+                        help="steps per segment (default: scaled to the grid size)")
+
+    play = commands.add_parser('replay', help="play a recording in a window")
+    play.add_argument('log')
+    play.add_argument('--cell-size', type=int, help="pixels per grid square")
+
+    export = commands.add_parser('export', help="render a recording to PNG frames")
+    export.add_argument('log')
+    export.add_argument('directory')
+    export.add_argument('--every', type=int, default=1, help="render every n-th step")
+    export.add_argument('--cell-size', type=int, default=4, help="pixels per grid square")
+    export.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+    if args.command == 'record' and args.seed is not None and not 0 <= args.seed <= MAX_SEED:
+        parser.error(f"--seed must be from 0 to {MAX_SEED}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'record':
+        record_run(args.log, args.algorithm, args.width, args.height, args.seed, args.solve,
+                   args.keyframe_interval)
+        log = EventLog(args.log)
+        print(f"{log.steps} steps, {os.path.getsize(args.log)} bytes -> {args.log}",
+              file=sys.stderr)
+    elif args.command == 'replay':
+        replay(args.log, args.cell_size)
+    else:
+        written = export_frames(args.log, args.directory, args.every, args.cell_size,
+                                args.workers)
+        print(f"{written} frames -> {args.directory}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Headless image rendering.
+
+Renders a maze straight from its array to PNG, with no display and no pygame. Pixels come
+from PALETTE lookups on the grid values, scaled up by repeating every square into a
+cell_size x cell_size block. The image is produced in bands of grid rows and compressed
+as it goes, so memory stays bounded however large the maze is:
+
+    python maze_render.py maze.png --algorithm kruskal --width 2000 --height 2000 --solution
+    python maze_render.py huge.png --input maze.npy --cell-size 1
+    python maze_render.py tiles/ --input maze.amz --cell-size 4 --tiles 4096
+
+The input can be a grid array (including an np.memmap such as a .npy file opened with
+mmap_mode='r') or a CompactMaze, whose rows are expanded one band at a time; a
+CompactMaze holds no entrance or exit, so those are passed in as markers. A single
+PNG is written as a 4-bit indexed-colour image with one streamed IDAT chunk per band; with
+tiling, the image is cut into square PNG tiles named tile_<row>_<column>.png instead, for
+viewers that cannot open one huge file.
+"""
+import argparse
+import os
+import struct
+import sys
+import zlib
+
+import numpy as np
+
+from maze_compact import CompactMaze
+from maze_core import entrance_and_exit, find_markers
+from maze_io import open_compact
+from maze_model import GENERATORS, Maze
+
+# Colour for each maze cell value: 0 path, 1 wall, 2 entrance, 3 exit, 4 solver in progress,
+# 5 solution path
+PALETTE = np.array([
+    (255, 255, 255),  # Path
+    (0, 0, 0),        # Wall
+    (255, 255, 255),  # Entrance
+    (255, 255, 255),  # Exit
+    (0, 0, 255),      # Solver in progress / backtracked
+    (255, 255, 0),    # Solution path
+], dtype=np.uint8)
+
+ENTRANCE, EXIT, SOLUTION = 2, 3, 5
+
+# Most pixel bytes held at once while rendering one band
+BAND_BYTES = 32 * 1024 * 1024
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _grid_shape(maze):
+    if isinstance(maze, CompactMaze):
+        return 2 * maze.height + 1, 2 * maze.width + 1
+    return maze.shape
+
+
+def _grid_band(maze, start, stop):
+    """Grid rows start..stop (exclusive) of an array or a CompactMaze, as an ndarray."""
+    if not isinstance(maze, CompactMaze):
+        return np.asarray(maze[start:stop])
+    # grid_rows() expands whole cell rows, including the wall rows on either side; the
+    # bottom border row is taken from the last cell row's band
+    first = min(start // 2, maze.height - 1)
+    rows = maze.grid_rows(first, min((stop + 1) // 2, maze.height))
+    return rows[start - 2 * first:stop - 2 * first]
+
+
+class _Overlay:
+    """
+    (x, y) grid squares and the values to paint on them, sorted by row so each band finds
+    its part quickly.
+    """
+
+    def __init__(self, points, values):
+        points = np.array(points, dtype=np.int64).reshape(-1, 2)
+        values = np.broadcast_to(np.asarray(values, dtype=np.uint8), len(points))
+        order = np.argsort(points[:, 1], kind='stable')
+        self.xs, self.ys, self.values = points[order, 0], points[order, 1], values[order]
+
+    def paint(self, band, start):
+        """Paint the squares of grid rows start.. that fall in `band`."""
+        first, last = np.searchsorted(self.ys, (start, start + len(band)))
+        if first < last:
+            band = band.copy()
+            band[self.ys[first:last] - start, self.xs[first:last]] = self.values[first:last]
+        return band
+
+
+def _overlay(solution, markers):
+    """
+    The _Overlay for a solution path, or for the (entrance, exit) markers when there is no
+    solution (a solution runs from one marker to the other); None when there is neither.
+    """
+    if solution:
+        return _Overlay(solution, SOLUTION)
+    if markers:
+        return _Overlay(markers, (ENTRANCE, EXIT))
+    return None
+
+
+def _upscale(band, cell_size):
+    """Repeat every square of a band into a cell_size x cell_size block of pixels."""
+    if cell_size == 1:
+        return band
+    return np.repeat(np.repeat(band, cell_size, axis=0), cell_size, axis=1)
+
+
+def _band_rows(columns, cell_size):
+    """Grid rows per band, so a band's pixels stay within BAND_BYTES."""
+    return max(1, BAND_BYTES // (columns * cell_size * cell_size))
+
+
+def _chunk(f, kind, data):
+    f.write(struct.pack('>I', len(data)) + kind + data
+            + struct.pack('>I', zlib.crc32(kind + data)))
+
+
+class _PngStream:
+    """
+    A 4-bit indexed PNG written as its pixel rows arrive: each block of rows is packed
+    two pixels to a byte, compressed and emitted as an IDAT chunk before the next one is
+    taken. Packing halves what zlib has to get through, which is most of the time spent.
+    """
+
+    def __init__(self, f, width, height, level):
+        self.f = f
+        self.width = width
+        self._compressor = zlib.compressobj(level)
+        f.write(_PNG_SIGNATURE)
+        _chunk(f, b'IHDR', struct.pack('>IIBBBBB', width, height, 4, 3, 0, 0, 0))
+        _chunk(f, b'PLTE', PALETTE.tobytes())
+
+    def write(self, block):
+        """Add an (n, width) uint8 block of palette indices."""
+        # Every scanline starts with its filter type, 0 (None), then the pixels high
+        # nibble first; an odd last pixel fills the high nibble of the last byte
+        pairs = self.width // 2
+        lines = np.zeros((len(block), 1 + (self.width + 1) // 2), dtype=np.uint8)
+        lines[:, 1:1 + pairs] = block[:, 0:2 * pairs:2] << 4 | block[:, 1:2 * pairs:2]
+        if self.width % 2:
+            lines[:, -1] = block[:, -1] << 4
+        data = self._compressor.compress(lines.tobytes())
+        if data:
+            _chunk(self.f, b'IDAT', data)
+
+    def close(self):
+        _chunk(self.f, b'IDAT', self._compressor.flush())
+        _chunk(self.f, b'IEND', b'')
+
+
+def _pixel_bands(maze, cell_size, overlay, start=0, stop=None):
+    """Yield the pixel rows of grid rows start..stop, one band at a time."""
+    rows, columns = _grid_shape(maze)
+    stop = rows if stop is None else stop
+    step = _band_rows(columns, cell_size)
+    for first in range(start, stop, step):
+        band = _grid_band(maze, first, min(first + step, stop))
+        if overlay is not None:
+            band = overlay.paint(band, first)
+        yield _upscale(band, cell_size)
+
+
+def write_png(path, maze, cell_size=1, solution=None, level=3, markers=None):
+    """
+    Render a maze to one PNG file, band by band.
+
+    Args:
+        path (str): Output file
+        maze (numpy.ndarray or CompactMaze): Grid to render; any values PALETTE covers
+        cell_size (int): Pixels per grid square
+        solution (list): (x, y) grid squares to paint as the solution, or None
+        level (int): zlib compression level
+        markers (tuple): (entrance, exit) grid positions to paint as open, for a
+            CompactMaze; None when the grid already holds them
+
+    Returns:
+        tuple: (width, height) of the image in pixels.
+    """
+    rows, columns = _grid_shape(maze)
+    overlay = _overlay(solution, markers)
+    size = (columns * cell_size, rows * cell_size)
+    with open(path, 'wb') as f:
+        png = _PngStream(f, *size, level)
+        for pixels in _pixel_bands(maze, cell_size, overlay):
+            png.write(pixels)
+        png.close()
+    return size
+
+
+def write_tiles(directory, maze, cell_size=1, solution=None, tile_size=4096, level=3,
+                markers=None):
+    """
+    Render a maze to square PNG tiles of `tile_size` pixels, named
+    tile_<row>_<column>.png; tiles on the right and bottom edges are cut short.
+
+    The tiles of one row are written side by side: every band is rendered once and its
+    pixels are split between them, so memory is bounded by the band size, not the maze.
+
+    Args:
+        directory (str): Output directory, created when missing
+        maze (numpy.ndarray or CompactMaze): Grid to render
+        cell_size (int): Pixels per grid square
+        solution (list): (x, y) grid squares to paint as the solution, or None
+        tile_size (int): Side of a tile in pixels
+        level (int): zlib compression level
+        markers (tuple): (entrance, exit) grid positions to paint as open, or None
+
+    Returns:
+        tuple: (columns, rows) of tiles written.
+    """
+    rows, columns = _grid_shape(maze)
+    overlay = _overlay(solution, markers)
+    os.makedirs(directory, exist_ok=True)
+    width, height = columns * cell_size, rows * cell_size
+    tiles_x, tiles_y = -(-width // tile_size), -(-height // tile_size)
+    lefts = range(0, width, tile_size)
+
+    for tile_y in range(tiles_y):
+        top, bottom = tile_y * tile_size, min((tile_y + 1) * tile_size, height)
+        files = [open(os.path.join(directory, f'tile_{tile_y}_{tile_x}.png'), 'wb')
+                 for tile_x in range(tiles_x)]
+        try:
+            pngs = [_PngStream(f, min(tile_size, width - left), bottom - top, level)
+                    for f, left in zip(files, lefts)]
+            # The tile row starts `skip` pixel rows into its first grid row
+            skip, remaining = top % cell_size, bottom - top
+            for pixels in _pixel_bands(maze, cell_size, overlay, top // cell_size,
+                                       -(-bottom // cell_size)):
+                band_height = len(pixels)
+                pixels = pixels[skip:skip + remaining]
+                skip, remaining = max(0, skip - band_height), remaining - len(pixels)
+                for png, left in zip(pngs, lefts):
+                    png.write(pixels[:, left:left + tile_size])
+            for png in pngs:
+                png.close()
+        finally:
+            for f in files:
+                f.close()
+    return tiles_x, tiles_y
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render a maze to PNG without a display.")
+    parser.add_argument('output', help="PNG file, or directory with --tiles")
+    parser.add_argument('--input', help=".amz or .npy maze to render instead of generating one")
+    parser.add_argument('--algorithm', choices=sorted(GENERATORS), default='kruskal')
+    parser.add_argument('--width', type=int, default=50, help="maze width in cells")
+    parser.add_argument('--height', type=int, default=50, help="maze height in cells")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--cell-size', type=int, default=4, help="pixels per grid square")
+    parser.add_argument('--solution', action='store_true',
+                        help="draw the solution (needs the whole maze in memory)")
+    parser.add_argument('--tiles', type=int, metavar='SIZE',
+                        help="write SIZE x SIZE pixel tiles into the output directory")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    markers = None
+    if args.input is None:
+        maze = Maze.generate(args.width, args.height, args.algorithm, seed=args.seed).grid
+    elif args.input.endswith('.npy'):
+        maze = np.load(args.input, mmap_mode='r')
+    else:
+        header, maze = open_compact(args.input)
+        markers = header['entrance'], header['exit']
+        if not all(markers):
+            # Where add_maze_entrance_and_exit() puts them
+            markers = (1, 0), (2 * maze.width - 1, 2 * maze.height)
+
+    solution = None
+    if args.solution:
+        grid = maze.to_grid() if isinstance(maze, CompactMaze) else np.asarray(maze)
+        # Solve between the markers stored with the maze: in a .amz header, or in the grid
+        entrance, exit = markers or find_markers(grid)
+        if not (entrance and exit):
+            entrance, exit = entrance_and_exit(grid)
+        solution = Maze(grid, entrance=entrance, exit=exit).solution()
+        del grid
+
+    if args.tiles:
+        tiles = write_tiles(args.output, maze, args.cell_size, solution, args.tiles,
+                            markers=markers)
+        print(f"{tiles[0]}x{tiles[1]} tiles -> {args.output}", file=sys.stderr)
+    else:
+        size = write_png(args.output, maze, args.cell_size, solution, markers=markers)
+        print(f"{size[0]}x{size[1]} pixels -> {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
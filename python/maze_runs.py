@@ -0,0 +1,61 @@
+"""
+Run merging for the exporters.
+
+runs() finds the maximal runs of True squares along the rows of a boolean grid, and
+stack_runs() merges runs with the same span in consecutive rows into rectangles; pass a
+transposed grid to work down the columns instead. maze_minecraft covers the walls with
+these rectangles (overlapping) for fill commands, and maze_unity greedy-meshes them into
+disjoint boxes.
+"""
+import numpy as np
+
+
+def runs(mask):
+    """
+    Maximal runs of True along each row of a 2D boolean array.
+
+    Returns:
+        tuple: (rows, starts, ends) arrays, ends inclusive, in row-major order.
+    """
+    padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows, starts, ends - 1
+
+
+def stack_runs(rows, starts, ends):
+    """
+    Merge runs with the same span in consecutive rows.
+
+    Returns:
+        numpy.ndarray: (n, 4) array of (first row, start, last row, end).
+    """
+    if not len(rows):
+        return np.empty((0, 4), dtype=np.int64)
+    order = np.lexsort((rows, ends, starts))
+    rows, starts, ends = rows[order], starts[order], ends[order]
+    new = np.ones(len(rows), dtype=bool)
+    new[1:] = (starts[1:] != starts[:-1]) | (ends[1:] != ends[:-1]) | (rows[1:] != rows[:-1] + 1)
+    first = np.flatnonzero(new)
+    last = np.append(first[1:], len(rows)) - 1
+    return np.column_stack((rows[first], starts[first], rows[last], ends[first]))
+
+
+def long_runs(mask):
+    """
+    The runs of runs() at least two squares long, and a mask of the squares they cover.
+
+    Returns:
+        tuple: (rows, starts, ends, covered)
+    """
+    rows, starts, ends = runs(mask)
+    long = ends > starts
+    rows, starts, ends = rows[long], starts[long], ends[long]
+    # Mark +1/-1 at the ends of each run and sum along the rows (runs never touch)
+    marks = np.zeros((mask.shape[0], mask.shape[1] + 1), dtype=np.int8)
+    marks[rows, starts] = 1
+    marks[rows, ends + 1] = -1
+    covered = np.cumsum(marks[:, :-1], axis=1, dtype=np.int8) > 0
+    return rows, starts, ends, covered
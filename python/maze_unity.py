@@ -0,0 +1,130 @@
+"""
+Unity maze asset export.
+
+Writes a maze as a small binary asset for unity/MazeAssetLoader.cs. The asset holds the
+walls as merged boxes, so Unity can build the whole maze from a few combined meshes
+instead of one GameObject per grid square like BoardGenerator:
+
+    python maze_unity.py --algorithm kruskal --width 500 --height 500 --output maze.bytes
+
+Save it with the .bytes extension so Unity imports it as a TextAsset.
+
+The wall grid is greedy-meshed into disjoint rectangles: horizontal runs of two or more
+wall squares come first, then the squares they leave are taken as vertical runs, and
+runs with the same span in consecutive rows (or columns) are merged into one box.
+
+File layout (little-endian):
+    header    32 bytes: magic b'AMZU', version, grid columns and rows (H each), box count
+              and solution point count (I each), entrance x, y and exit x, y (H each),
+              then padding
+    boxes     H x0, y0, x1, y1 per box, inclusive grid squares
+    solution  H x, y per point: the corners of the solution path, entrance to exit
+
+Grid x maps to Unity +x and grid y to +z, as in BoardGenerator.
+"""
+import argparse
+import struct
+import sys
+
+import numpy as np
+
+from maze_core import entrance_and_exit, find_markers
+from maze_model import GENERATORS, Maze
+from maze_runs import long_runs, runs, stack_runs
+
+MAGIC = b'AMZU'
+FORMAT_VERSION = 1
+
+# Coordinates are stored as uint16
+MAX_GRID_SIDE = 0xFFFF
+
+_HEADER = struct.Struct('<4sHHHIIHHHH6x')
+
+
+def wall_boxes(grid):
+    """
+    Greedy-mesh the wall squares (1) of a grid into disjoint rectangles.
+
+    Returns:
+        numpy.ndarray: (n, 4) array of inclusive (x0, y0, x1, y1) grid rectangles.
+    """
+    walls = grid == 1
+    rows, starts, ends, covered = long_runs(walls)
+    horizontal = stack_runs(rows, starts, ends)
+    columns, top, bottom = runs((walls & ~covered).T)
+    vertical = stack_runs(columns, top, bottom)
+    return np.concatenate((horizontal[:, [1, 0, 3, 2]], vertical))
+
+
+def path_corners(path):
+    """Drop the points of an (x, y) path that sit on a straight line between their neighbours."""
+    if len(path) < 3:
+        return list(path)
+    points = np.array(path)
+    steps = np.diff(points, axis=0)
+    turns = np.flatnonzero(np.any(steps[1:] != steps[:-1], axis=1)) + 1
+    keep = np.concatenate(([0], turns, [len(points) - 1]))
+    return [tuple(point) for point in points[keep].tolist()]
+
+
+def export_unity(path, grid, solution=None, entrance=None, exit=None):
+    """
+    Write a maze asset for MazeAssetLoader.
+
+    Args:
+        path (str): Output file, normally ending in .bytes
+        grid (numpy.ndarray): Maze grid; only walls (1) are read, so solver marks are fine
+        solution (list): (x, y) grid path from entrance to exit; found from the grid
+            when omitted
+        entrance (tuple): (x, y) of the entrance; read from the 2 in the grid when
+            omitted, or where add_maze_entrance_and_exit() puts it when there is none
+        exit (tuple): (x, y) of the exit; read from the 3 in the grid likewise
+
+    Returns:
+        dict: Number of boxes and solution points written.
+
+    Raises:
+        ValueError: If the grid is too large for the 16-bit coordinates.
+    """
+    rows, cols = grid.shape
+    if rows > MAX_GRID_SIDE or cols > MAX_GRID_SIDE:
+        raise ValueError(f"a {cols}x{rows} grid does not fit the asset's 16-bit coordinates")
+
+    if entrance is None or exit is None:
+        entrance, exit = find_markers(grid)
+        if not entrance or not exit:
+            entrance, exit = entrance_and_exit(grid)
+    if solution is None:
+        walls = (grid == 1).astype(np.uint8)
+        solution = Maze(walls, entrance=entrance, exit=exit).solution()
+    boxes = wall_boxes(grid).astype('<u2')
+    corners = np.array(path_corners(solution), dtype='<u2').reshape(-1, 2)
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, cols, rows, len(boxes), len(corners),
+                             *entrance, *exit))
+        f.write(boxes.tobytes())
+        f.write(corners.tobytes())
+    return {'boxes': len(boxes), 'solution_points': len(corners)}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export a maze as a Unity asset.")
+    parser.add_argument('--algorithm', choices=sorted(GENERATORS), default='kruskal')
+    parser.add_argument('--width', type=int, default=50, help="maze width in cells")
+    parser.add_argument('--height', type=int, default=50, help="maze height in cells")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--output', default='maze.bytes', help="asset file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    maze = Maze.generate(args.width, args.height, args.algorithm, seed=args.seed)
+    stats = export_unity(args.output, maze.grid, maze.solution(), maze.entrance, maze.exit)
+    print(f"{stats['boxes']} wall boxes, {stats['solution_points']} solution points "
+          f"-> {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+"""
+Pygame front end for the maze engine: display setup, drawing, sounds and screenshots.
+
+Importing this module does not touch the display or the mixer; call init_display()
+from the interactive entry point before opening a window.
+"""
+import functools
+import os
+import time
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+import pygame
+
+from maze_render import PALETTE
+
+# Constants
+CELL_SIZE = 20
+FPS = 60
+
+# Animation pacing for play_steps(): algorithm steps advanced per frame to begin with (the
+# +/- keys double and halve it at run time, 0 removes the limit), and the seconds of each
+# frame that stepping may use before the frame is drawn regardless
+STEPS_PER_FRAME = 2
+FRAME_BUDGET = 0.75 / FPS
+
+# Synthesis parameters of each sound effect, passed to generate_sound()
+SOUND_SPECS = {
+    'wall_carve': dict(frequency=440, duration=0.15, volume=0.3, waveform='sine', attack=0.05,
+                       decay=0.05),
+    'path_create': dict(frequency=520, duration=0.15, volume=0.3, waveform='triangle',
+                        attack=0.05, decay=0.05),
+    'explore': dict(frequency=600, duration=0.1, volume=0.2, waveform='sine', attack=0.03,
+                    decay=0.03),
+    'backtrack': dict(frequency=380, duration=0.1, volume=0.2, waveform='sine', attack=0.03,
+                      decay=0.03),
+    'path_complete': dict(frequency=800, duration=0.3, volume=0.5, waveform='triangle',
+                          attack=0.1, decay=0.1),
+}
+
+# Pitch ratios of the variants kept for each sound (root, major second, third, fifth); a
+# frame with more requests for a sound plays a higher variant
+PITCH_VARIANTS = (1.0, 2 ** (2 / 12), 2 ** (4 / 12), 2 ** (7 / 12))
+
+# Mixer channels shared by every sound effect
+SOUND_CHANNELS = 8
+
+# Shortest gap in seconds between two plays of the same sound; requests inside it are dropped
+SOUND_MIN_INTERVAL = 0.06
+SOUND_MIN_INTERVALS = {'path_complete': 0.0}
+
+# Pitch variants of each sound effect, synthesized by init_display(); stays empty when no
+# audio device is available
+SOUNDS = {}
+
+
+def init_display():
+    """
+    Start pygame and, when an audio device is present, the mixer and the sound effects.
+    """
+    global _scheduler
+    pygame.init()
+
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Audio unavailable, continuing without sound: {e}")
+        return
+
+    for name, spec in SOUND_SPECS.items():
+        SOUNDS[name] = [cached_sound(**dict(spec, frequency=spec['frequency'] * ratio))
+                        for ratio in PITCH_VARIANTS]
+    _scheduler = SoundScheduler(SOUNDS)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_sound(**spec):
+    """generate_sound() with its volume applied, synthesized once per set of parameters."""
+    sound = generate_sound(**spec)
+    sound.set_volume(spec['volume'])
+    return sound
+
+
+class SoundScheduler:
+    """
+    Play sound effects at most once per frame each, rate-limited, on a fixed channel pool.
+
+    request() only counts, so algorithms can ask for a sound on every step; flush(), once
+    per frame, plays each requested sound that has not played within its minimum interval.
+    When every channel is busy, the next one in rotation (the oldest) is cut off.
+    """
+
+    def __init__(self, sounds, channels=SOUND_CHANNELS):
+        self.sounds = sounds
+        pygame.mixer.set_num_channels(channels)
+        self._channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._next_channel = 0
+        self._requests = Counter()
+        self._last_played = {}
+
+    def request(self, name):
+        if name in self.sounds:
+            self._requests[name] += 1
+
+    def clear(self):
+        """Drop the requests made since the last flush()."""
+        self._requests.clear()
+
+    def flush(self):
+        now = time.perf_counter()
+        for name, count in self._requests.items():
+            interval = SOUND_MIN_INTERVALS.get(name, SOUND_MIN_INTERVAL)
+            if now - self._last_played.get(name, -interval) < interval:
+                continue
+            variants = self.sounds[name]
+            # One request plays the root; every doubling moves one variant up
+            self._channel().play(variants[min(count.bit_length() - 1, len(variants) - 1)])
+            self._last_played[name] = now
+        self._requests.clear()
+
+    def _channel(self):
+        channels = len(self._channels)
+        for offset in range(channels):
+            channel = self._channels[(self._next_channel + offset) % channels]
+            if not channel.get_busy():
+                break
+        else:
+            channel = self._channels[self._next_channel]
+        self._next_channel = (self._channels.index(channel) + 1) % channels
+        return channel
+
+
+# Scheduler for SOUNDS, created by init_display() when audio is available
+_scheduler = None
+
+
+def play_sound(name):
+    """
+    Request a sound effect by name for the current frame; silently does nothing if audio
+    was not initialized.
+    """
+    if _scheduler is not None:
+        _scheduler.request(name)
+
+
+def flush_sounds():
+    """Play the sounds requested during this frame (see SoundScheduler)."""
+    if _scheduler is not None:
+        _scheduler.flush()
+
+
+def save_maze_to_png(screen):
+    """
+    Save the current maze screen as a PNG file.
+
+    To render a maze array at any size without a window, use maze_render.write_png().
+
+    Args:
+        screen (pygame.Surface): The Pygame screen surface to save
+    """
+    try:
+        # Create a 'maze_screenshots' directory if it doesn't exist
+        os.makedirs('maze_screenshots', exist_ok=True)
+
+        # Generate a filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = os.path.join('maze_screenshots', f'maze_{timestamp}.png')
+
+        # Save the screen to PNG
+        pygame.image.save(screen, filename)
+
+        # Optional: print confirmation (you could replace this with on-screen text)
+        print(f"Maze screenshot saved: {filename}")
+
+    except Exception as e:
+        print(f"Error saving screenshot: {e}")
+
+
+def generate_sound(frequency=440, duration=0.1, volume=0.5, waveform='sine', attack=0.02, decay=0.02):
+    """Generate a sound wave with basic waveforms and volume envelope."""
+    sample_rate = 44100  # Standard sample rate
+    samples = np.arange(int(sample_rate * duration)) / sample_rate
+
+    if waveform == 'sine':
+        wave = np.sin(2 * np.pi * frequency * samples)
+    elif waveform == 'square':
+        wave = np.sign(np.sin(2 * np.pi * frequency * samples))
+    elif waveform == 'triangle':
+        wave = 2 * np.abs(2 * (samples * frequency - np.floor(samples * frequency + 0.5))) - 1
+    else:
+        raise ValueError("Unsupported waveform type")
+
+    # Apply an envelope (fade in, fade out)
+    envelope = np.ones_like(wave)
+    attack_samples = int(sample_rate * attack)
+    decay_samples = int(sample_rate * decay)
+    envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+    envelope[-decay_samples:] = np.linspace(1, 0, decay_samples)
+
+    # Apply the envelope to the wave
+    wave = wave * envelope
+
+    # Normalize and scale to int16
+    wave = (wave * 32767 / np.max(np.abs(wave))).astype(np.int16)
+
+    # Create stereo sound array
+    stereo_wave = np.column_stack((wave, wave))
+
+    # Convert to a pygame sound object
+    return pygame.sndarray.make_sound(stereo_wave)
+
+
+HIGHLIGHT_COLOR = (0, 255, 0)
+
+# Fraction of changed cells above which a full-surface redraw beats filling cells one by one
+FULL_REDRAW_FRACTION = 0.25
+
+
+def frame_surface(frame, cell_size=CELL_SIZE, current_cell=None):
+    """
+    Render a grid to a new surface of `cell_size` pixels per grid square; works without a
+    display, so it can be used to write image files offline.
+    """
+    cells = pygame.surfarray.make_surface(PALETTE[frame].transpose(1, 0, 2))
+    size = (frame.shape[1] * cell_size, frame.shape[0] * cell_size)
+    surface = pygame.transform.scale(cells, size)
+    if current_cell:
+        x, y = current_cell
+        pygame.draw.rect(surface, HIGHLIGHT_COLOR,
+                         (x * cell_size, y * cell_size, cell_size, cell_size), 3)
+    return surface
+
+
+class MazeRenderer:
+    """
+    Draw a maze array onto a pygame surface, repainting only the cells that changed.
+
+    The first frame (and any frame where most of the grid changed) is produced by mapping
+    the whole array through PALETTE and scaling a one-pixel-per-cell surface up in a
+    single blit. After that, only cells whose value differs from the previous frame,
+    plus the previously highlighted cell, are filled. When the caller knows which cells
+    may have changed (the `changed` indices of the step generators), only those are
+    compared; otherwise the whole frame is.
+    """
+
+    def __init__(self, screen, cell_size=CELL_SIZE):
+        self.screen = screen
+        self.cell_size = cell_size
+        self._frame = None
+        self._highlight = None
+
+    def invalidate(self):
+        """Force the next draw() to repaint the whole surface."""
+        self._frame = None
+
+    def draw(self, frame, current_cell=None, changed=None):
+        """
+        Draw one frame.
+
+        Args:
+            frame (numpy.ndarray): Grid of cell values indexing PALETTE
+            current_cell (tuple): (x, y) cell to outline, or None
+            changed (numpy.ndarray): Flat indices of every cell that may differ from the
+                frame drawn last, or None to compare the whole frame
+        """
+        if self._frame is None or self._frame.shape != frame.shape:
+            self._draw_full(frame)
+        else:
+            if changed is None:
+                ys, xs = np.nonzero(frame != self._frame)
+            else:
+                changed = np.unique(changed)
+                changed = changed[frame.flat[changed] != self._frame.flat[changed]]
+                ys, xs = np.divmod(changed, frame.shape[1])
+            if len(ys) > FULL_REDRAW_FRACTION * frame.size:
+                self._draw_full(frame)
+            else:
+                self._draw_cells(frame, xs, ys)
+                self._frame[ys, xs] = frame[ys, xs]
+
+        # The old highlight outline sits on top of an unchanged cell, so repaint that cell
+        if self._highlight is not None and self._highlight != current_cell:
+            hx, hy = self._highlight
+            self._draw_cells(frame, (hx,), (hy,))
+
+        # Highlight current cell
+        if current_cell:
+            current_x, current_y = current_cell
+            pygame.draw.rect(self.screen, HIGHLIGHT_COLOR,
+                             (current_x * self.cell_size, current_y * self.cell_size,
+                              self.cell_size, self.cell_size), 3)
+        self._highlight = tuple(current_cell) if current_cell else None
+
+    def _draw_full(self, frame):
+        self.screen.fill((0, 0, 0))
+        self.screen.blit(frame_surface(frame, self.cell_size), (0, 0))
+        self._frame = np.array(frame, copy=True)
+
+    def _draw_cells(self, frame, xs, ys):
+        size = self.cell_size
+        for x, y in zip(xs, ys):
+            self.screen.fill(PALETTE[frame[y, x]], (x * size, y * size, size, size))
+
+
+# Renderer bound to the screen currently being animated
+_renderer = None
+
+
+def set_mode(size):
+    """
+    Open or resize the window with pygame.display.set_mode() and make the next draw repaint
+    it in full. set_mode() may hand back the Surface the renderer is already bound to, whose
+    record of what is on screen is then stale.
+    """
+    screen = pygame.display.set_mode(size)
+    if _renderer is not None and _renderer.screen is screen:
+        _renderer.invalidate()
+    return screen
+
+
+def get_renderer(screen):
+    """Return the shared MazeRenderer for `screen`, creating it when the screen changes."""
+    global _renderer
+    if _renderer is None or _renderer.screen is not screen:
+        _renderer = MazeRenderer(screen)
+    return _renderer
+
+
+# Steps per frame used by play_steps(), or None for as many as fit in FRAME_BUDGET
+_speed = STEPS_PER_FRAME
+
+SPEED_KEYS = {
+    pygame.K_PLUS: 2.0,
+    pygame.K_EQUALS: 2.0,
+    pygame.K_KP_PLUS: 2.0,
+    pygame.K_MINUS: 0.5,
+    pygame.K_KP_MINUS: 0.5,
+}
+
+
+def _finish(steps):
+    """Run a step generator to the end without drawing and return its result."""
+    try:
+        while True:
+            next(steps)
+    except StopIteration as done:
+        return done.value
+    finally:
+        if _scheduler is not None:
+            _scheduler.clear()
+
+
+def play_steps(screen, steps):
+    """
+    Animate a maze_core step generator at FPS and return its result.
+
+    Each frame advances the generator by the current speed in steps (a fractional speed
+    holds a step over several frames), but stops early once FRAME_BUDGET seconds have been
+    spent stepping, so a slow algorithm drops steps from the display rather than frames.
+    Only the latest step is drawn, comparing just the cells the frame's steps report as
+    changed, and the sounds queued during the frame play once each. The speed carries
+    over between calls.
+
+    Keys while running: + (or =) doubles the speed, - halves it and 0 removes the step
+    limit. Closing the window finishes the algorithm without drawing and leaves the QUIT
+    event queued for the caller.
+    """
+    global _speed
+    renderer = get_renderer(screen)
+    clock = pygame.time.Clock()
+    credit = 0.0
+    step = None
+    # Frame drawn last, and the `changed` indices of the steps since then (None when one of
+    # them did not say or switched frames, so the whole frame is compared)
+    shown = None
+    changed = None
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.event.post(event)
+                return _finish(steps)
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_0:
+                    _speed = None
+                elif event.key in SPEED_KEYS:
+                    _speed = max((_speed or 1024) * SPEED_KEYS[event.key], 1 / FPS)
+
+        credit = credit + _speed if _speed else float('inf')
+        deadline = time.perf_counter() + FRAME_BUDGET
+        try:
+            while credit >= 1:
+                step = next(steps)
+                credit -= 1
+                if step[2] is None or step[0] is not shown:
+                    changed = None
+                elif changed is not None:
+                    changed.append(step[2])
+                if time.perf_counter() >= deadline:
+                    credit = 0.0
+                    break
+        except StopIteration as done:
+            if step is not None:
+                renderer.draw(step[0])
+            flush_sounds()
+            pygame.display.flip()
+            return done.value
+
+        if step is not None:
+            frame, current_cell, _ = step
+            if changed is not None:
+                changed = np.concatenate([np.asarray(c, dtype=np.intp).ravel() for c in changed]
+                                         + [np.empty(0, dtype=np.intp)])
+            renderer.draw(frame, current_cell, changed)
+            shown, changed = frame, []
+        flush_sounds()
+        pygame.display.flip()
+        clock.tick(FPS)
@@ -0,0 +1,80 @@
+"""Tests for maze_analytics. Run with pytest from the python directory."""
+from collections import Counter
+
+import pytest
+
+from maze_analytics import analyze
+from maze_model import GENERATORS, Maze
+
+
+def brute_force(grid):
+    """The analyze() counts, found cell by cell from an adjacency list."""
+    height, width = grid.shape[0] // 2, grid.shape[1] // 2
+    neighbours = {(x, y): [] for y in range(height) for x in range(width)}
+    for (x, y), cell in neighbours.items():
+        if x + 1 < width and grid[2 * y + 1, 2 * x + 2] != 1:
+            cell.append((x + 1, y))
+            neighbours[x + 1, y].append((x, y))
+        if y + 1 < height and grid[2 * y + 2, 2 * x + 1] != 1:
+            cell.append((x, y + 1))
+            neighbours[x, y + 1].append((x, y))
+
+    def distances(start):
+        found = {start: 0}
+        queue = [start]
+        for cell in queue:
+            for neighbour in neighbours[cell]:
+                if neighbour not in found:
+                    found[neighbour] = found[cell] + 1
+                    queue.append(neighbour)
+        return found
+
+    from_start = distances((0, 0))
+    farthest = max(from_start, key=from_start.get)
+
+    # Walk every corridor from each dead end or junction; each is met from both ends
+    def is_node(cell):
+        return len(neighbours[cell]) != 2
+
+    corridors = Counter()
+    for cell in filter(is_node, neighbours):
+        for current in neighbours[cell]:
+            previous, length = cell, 1
+            while not is_node(current):
+                previous, current = current, next(
+                    n for n in neighbours[current] if n != previous)
+                length += 1
+            corridors[length] += 1
+
+    degrees = Counter(len(cell) for cell in neighbours.values())
+    return {
+        'dead_ends': degrees[1],
+        'corridors': degrees[2],
+        'junctions': degrees[3],
+        'crossroads': degrees[4],
+        'corridor_lengths': {length: count // 2 for length, count in corridors.items()},
+        'solution_length': from_start[width - 1, height - 1],
+        'diameter': max(distances(farthest).values()),
+    }
+
+
+@pytest.mark.parametrize('algorithm', sorted(GENERATORS))
+@pytest.mark.parametrize('width, height', [(1, 1), (1, 6), (6, 1), (2, 2), (7, 5), (20, 13)])
+def test_counts_match_brute_force(algorithm, width, height):
+    for seed in range(3):
+        maze = Maze.generate(width, height, algorithm, seed=seed)
+        stats = analyze(maze.grid, maze.entrance, maze.exit)
+        expected = brute_force(maze.grid)
+        histogram = {length: count
+                     for length, count in enumerate(stats['corridor_lengths']) if count}
+        assert histogram == expected.pop('corridor_lengths')
+        assert {key: stats[key] for key in expected} == expected
+        # Corridors split the tree's width * height - 1 passages between them
+        assert sum(length * count for length, count in histogram.items()) == width * height - 1
+
+
+def test_solver_marks_do_not_change_the_counts():
+    maze = Maze.generate(15, 11, 'kruskal', seed=4)
+    before = analyze(maze.grid, maze.entrance, maze.exit)
+    maze.solve('astar', visualize=False)
+    assert analyze(maze.grid, maze.entrance, maze.exit) == before
@@ -0,0 +1,30 @@
+"""Tests for maze_cache. Run with pytest from the python directory."""
+import numpy as np
+import pytest
+
+from maze_cache import MazeCache
+
+
+def test_seeded_mazes_are_cached(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    first = cache.get('kruskal', 10, 8, 7)
+    second = cache.get('kruskal', 10, 8, np.int64(7))
+    assert np.array_equal(first.grid, second.grid)
+    assert cache.hits == {'memory': 1, 'disk': 0, 'miss': 1}
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_unseeded_mazes_bypass_the_cache(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    cache.get('kruskal', 10, 8, None)
+    cache.get('kruskal', 10, 8, None)
+    assert cache.hits['miss'] == 2
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize('seed', [-1, 2 ** 64, 1.5])
+def test_out_of_range_seeds_are_rejected_before_generating(tmp_path, seed):
+    cache = MazeCache(str(tmp_path))
+    with pytest.raises(ValueError):
+        cache.get('kruskal', 10, 8, seed)
+    assert cache.hits['miss'] == 0
@@ -0,0 +1,46 @@
+"""Tests for maze_chunked. Run with pytest from the python directory."""
+import numpy as np
+import pytest
+
+from maze_chunked import generate_chunked
+
+
+def assert_perfect(grid, width, height):
+    """Every cell is reached from (0, 0), over exactly width * height - 1 passages."""
+    assert grid.shape == (2 * height + 1, 2 * width + 1)
+    assert (grid[1::2, 1::2] == 0).all()
+    east = grid[1::2, 2:-1:2] != 1
+    south = grid[2:-1:2, 1::2] != 1
+    assert east.sum() + south.sum() == width * height - 1
+
+    seen = np.zeros((height, width), dtype=bool)
+    seen[0, 0] = True
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack.pop()
+        for nx, ny, is_open in ((x + 1, y, x + 1 < width and east[y, x]),
+                                (x - 1, y, x > 0 and east[y, x - 1]),
+                                (x, y + 1, y + 1 < height and south[y, x]),
+                                (x, y - 1, y > 0 and south[y - 1, x])):
+            if is_open and not seen[ny, nx]:
+                seen[ny, nx] = True
+                stack.append((nx, ny))
+    assert seen.all()
+
+
+@pytest.mark.parametrize('algorithm', ['kruskal', 'dfs', 'sidewinder'])
+@pytest.mark.parametrize('width, height, tile_size', [(23, 17, 5), (8, 8, 8), (1, 9, 2)])
+def test_chunked_maze_is_perfect(algorithm, width, height, tile_size):
+    grid = generate_chunked(width, height, algorithm, tile_size, seed=7, workers=2)
+    assert_perfect(grid, width, height)
+    assert grid[0, 1] == 2 and grid[-1, -2] == 3
+
+
+def test_worker_count_does_not_change_the_maze(tmp_path):
+    one = generate_chunked(30, 20, 'wilson', 6, seed=11, workers=1)
+    three = generate_chunked(30, 20, 'wilson', 6, seed=11, workers=3)
+    mapped = generate_chunked(30, 20, 'wilson', 6, seed=11, workers=2,
+                              output=str(tmp_path / 'maze.npy'))
+    assert np.array_equal(one, three)
+    assert np.array_equal(one, mapped)
+    assert np.array_equal(one, np.load(tmp_path / 'maze.npy'))
@@ -0,0 +1,33 @@
+"""Tests for maze_core. Run with pytest from the python directory."""
+import numpy as np
+import pytest
+
+from maze_core import OFFSCREEN, add_maze_entrance_and_exit, carve_passages_prim, generate_maze
+from maze_model import GENERATORS, Maze
+
+
+def open_passages(grid):
+    """Number of opened walls between neighbouring cells."""
+    return int((grid[2:-1:2, 1::2] != 1).sum() + (grid[1::2, 2:-1:2] != 1).sum())
+
+
+def test_animated_prim_carves_a_spanning_tree():
+    # Animating used to open walls that had been rejected because both sides were visited
+    width, height = 14, 11
+    for seed in range(5):
+        grid = carve_passages_prim(generate_maze(width, height), width, height,
+                                   screen=OFFSCREEN, visualize=True, rng=seed)
+        assert open_passages(grid) == width * height - 1
+        add_maze_entrance_and_exit(grid)
+        assert (Maze(grid).tree >= 0).all()
+
+
+@pytest.mark.parametrize('algorithm', sorted(GENERATORS))
+def test_seed_fixes_the_maze_whether_animated_or_not(algorithm):
+    carve = GENERATORS[algorithm]
+    width, height = 13, 9
+    for seed in range(3):
+        headless = carve(generate_maze(width, height), width, height, visualize=False, rng=seed)
+        animated = carve(generate_maze(width, height), width, height,
+                         screen=OFFSCREEN, visualize=True, rng=np.int64(seed))
+        assert np.array_equal(headless, animated)
@@ -0,0 +1,122 @@
+"""Tests for maze_io and maze_compact. Run with pytest from the python directory."""
+import numpy as np
+import pytest
+
+from maze_compact import CompactMaze
+from maze_core import eller_rows
+from maze_io import (
+    grid_from_tree_bits,
+    load_maze,
+    open_archive,
+    open_compact,
+    read_header,
+    save_archive,
+    save_maze,
+    tree_bits,
+)
+from maze_model import Maze
+
+
+def stored_walls(grid):
+    """The 0/1 grid a CompactMaze keeps: marks read as open and the border stays closed."""
+    walls = (grid == 1).astype(np.uint8)
+    walls[[0, -1]] = walls[:, [0, -1]] = 1
+    return walls
+
+
+@pytest.mark.parametrize('width, height', [(1, 1), (7, 5), (8, 3), (9, 12)])
+def test_compact_round_trip(width, height):
+    grid = Maze.generate(width, height, 'wilson', seed=width).grid
+    compact = CompactMaze.from_grid(grid)
+    assert compact.nbytes == 2 * height * ((width + 7) // 8)
+    assert np.array_equal(compact.to_grid(), stored_walls(grid))
+    for y in range(height):
+        for x in range(width):
+            assert compact.has_east_wall(x, y) == (grid[2 * y + 1, 2 * x + 2] == 1)
+            assert compact.has_south_wall(x, y) == (grid[2 * y + 2, 2 * x + 1] == 1)
+
+
+def test_grid_rows_bands_tile_the_grid():
+    grid = CompactMaze.from_grid(Maze.generate(9, 7, 'kruskal', seed=1).grid).to_grid()
+    compact = CompactMaze.from_grid(grid)
+    for start in range(7):
+        for stop in range(start + 1, 8):
+            assert np.array_equal(compact.grid_rows(start, stop), grid[2 * start:2 * stop + 1])
+
+
+def test_from_rows_matches_from_grid():
+    rows = list(eller_rows(10, 6, rng=4))
+    streamed = CompactMaze.from_rows(iter(rows), 10, 6)
+    assert np.array_equal(streamed.to_grid(), CompactMaze.from_grid(np.array(rows)).to_grid())
+
+
+def test_amz_round_trip(tmp_path):
+    maze = Maze.generate(11, 6, 'prim', seed=2 ** 64 - 1)
+    path = str(tmp_path / 'maze.amz')
+    save_maze(path, maze)
+
+    header = read_header(path)
+    assert (header['width'], header['height']) == (11, 6)
+    assert header['algorithm'] == 'prim' and header['seed'] == 2 ** 64 - 1
+    assert (header['entrance'], header['exit']) == (maze.entrance, maze.exit)
+
+    loaded = load_maze(path)
+    assert np.array_equal(loaded.grid, maze.grid)
+    assert (loaded.entrance, loaded.exit) == (maze.entrance, maze.exit)
+
+
+def test_amz_opens_as_a_memmap(tmp_path):
+    maze = Maze.generate(20, 9, 'kruskal', seed=5)
+    path = str(tmp_path / 'maze.amz')
+    save_maze(path, maze)
+
+    _, compact = open_compact(path)
+    assert isinstance(compact.east.base, np.memmap)
+    assert np.shares_memory(compact.east, compact.south.base)
+    assert np.array_equal(compact.to_grid(), stored_walls(maze.grid))
+
+    # Writes through an r+ map land in the file
+    _, compact = open_compact(path, mode='r+')
+    compact.east[0, 0] &= 0x7F
+    compact.east.base.flush()
+    assert load_maze(path).grid[1, 2] == 0
+
+
+def test_amzt_round_trip(tmp_path):
+    grids = [Maze.generate(6, 4, 'kruskal', seed=seed).grid for seed in range(5)]
+    path = str(tmp_path / 'mazes.amzt')
+    assert save_archive(path, iter(grids), 6, 4) == 5
+
+    width, height, records = open_archive(path)
+    assert (width, height) == (6, 4) and records.shape == (5, len(tree_bits(grids[0])))
+    for grid, record in zip(grids, records):
+        assert np.array_equal(grid_from_tree_bits(record, 6, 4), stored_walls(grid))
+
+
+def test_empty_amzt_opens(tmp_path):
+    path = str(tmp_path / 'mazes.amzt')
+    save_archive(path, [], 6, 4)
+    assert open_archive(path)[2].shape[0] == 0
+
+
+def test_truncated_amz_is_rejected(tmp_path):
+    path = tmp_path / 'maze.amz'
+    save_maze(str(path), Maze.generate(20, 9, 'kruskal', seed=5))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match='truncated'):
+        open_compact(str(path))
+    path.write_bytes(path.read_bytes()[:10])
+    with pytest.raises(ValueError, match='not a maze file'):
+        read_header(str(path))
+
+
+def test_truncated_amzt_is_rejected(tmp_path):
+    path = tmp_path / 'mazes.amzt'
+    grids = [Maze.generate(6, 4, 'kruskal', seed=seed).grid for seed in range(3)]
+    save_archive(str(path), grids, 6, 4)
+    path.write_bytes(path.read_bytes()[:-2])
+    with pytest.raises(ValueError, match='truncated'):
+        open_archive(str(path))
+    path.write_bytes(path.read_bytes()[:5])
+    with pytest.raises(ValueError, match='not a maze archive'):
+        open_archive(str(path))
@@ -0,0 +1,68 @@
+"""Tests for maze_minecraft. Run with pytest from the python directory."""
+import re
+
+import numpy as np
+import pytest
+
+from maze_core import solve_maze_flood_fill
+from maze_minecraft import (
+    ENTRANCE_BLOCK,
+    EXIT_BLOCK,
+    MAX_FILL_VOLUME,
+    WALL_BLOCK,
+    build_commands,
+    export_datapack,
+    wall_rectangles,
+)
+from maze_model import GENERATORS, Maze
+
+
+def marker_commands(commands):
+    return [command for command in commands if command.startswith('setblock')]
+
+
+def test_markers_are_read_from_the_grid():
+    maze = Maze.generate(8, 6, 'kruskal', seed=1)
+    (ex, ey), (xx, xy) = maze.entrance, maze.exit
+    assert marker_commands(build_commands(maze.grid)) == [
+        f"setblock ~{ex} ~-1 ~{ey} {ENTRANCE_BLOCK}", f"setblock ~{xx} ~-1 ~{xy} {EXIT_BLOCK}"]
+
+
+def test_solved_grid_keeps_its_entrance_and_exit(tmp_path):
+    # Solving paints the entrance and exit over with 5, so they are passed explicitly
+    maze = Maze.generate(8, 6, 'kruskal', seed=1)
+    grid = maze.grid.copy()
+    solve_maze_flood_fill(grid, entrance=maze.entrance, exit=maze.exit)
+    assert not ((grid == 2) | (grid == 3)).any()
+
+    commands = build_commands(grid, entrance=maze.entrance, exit=maze.exit)
+    assert marker_commands(commands) == marker_commands(build_commands(maze.grid))
+
+    export_datapack(grid, str(tmp_path), entrance=maze.entrance, exit=maze.exit)
+    built = '\n'.join(path.read_text() for path in tmp_path.rglob('part_*.mcfunction'))
+    assert ENTRANCE_BLOCK in built and EXIT_BLOCK in built
+
+
+@pytest.mark.parametrize('algorithm', sorted(GENERATORS))
+def test_wall_rectangles_cover_exactly_the_walls(algorithm):
+    for width, height in [(1, 1), (9, 4), (16, 11)]:
+        grid = Maze.generate(width, height, algorithm, seed=3).grid
+        cover = np.zeros(grid.shape, dtype=bool)
+        for x0, y0, x1, y1 in wall_rectangles(grid).tolist():
+            assert (grid[y0:y1 + 1, x0:x1 + 1] == 1).all()
+            cover[y0:y1 + 1, x0:x1 + 1] = True
+        assert np.array_equal(cover, grid == 1)
+
+
+def test_wall_fills_stay_within_the_volume_limit():
+    grid = Maze.generate(200, 3, 'binary_tree', seed=1).grid
+    fill = re.compile(r"fill ~(\d+) ~(-?\d+) ~(\d+) ~(\d+) ~(-?\d+) ~(\d+) (\S+)")
+    cover = np.zeros(grid.shape, dtype=bool)
+    for command in build_commands(grid, wall_height=200):
+        if command.startswith('fill'):
+            x0, y0, z0, x1, y1, z1, block = fill.fullmatch(command).groups()
+            x0, y0, z0, x1, y1, z1 = map(int, (x0, y0, z0, x1, y1, z1))
+            assert (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1) <= MAX_FILL_VOLUME
+            if block == WALL_BLOCK:
+                cover[z0:z1 + 1, x0:x1 + 1] = True
+    assert np.array_equal(cover, grid == 1)
@@ -0,0 +1,22 @@
+"""Tests for maze_model. Run with pytest from the python directory."""
+import pytest
+
+from maze_model import GENERATORS, Maze
+
+
+@pytest.mark.parametrize('algorithm', sorted(GENERATORS))
+def test_tree_spans_every_cell(algorithm):
+    # A flood with no goal used to stop once it reached the last (bottom-right) cell
+    for seed in range(10):
+        maze = Maze.generate(12, 9, algorithm, seed=seed)
+        assert (maze.tree >= 0).all()
+        assert (maze.tree == 4).sum() == 1
+
+
+def test_solution_runs_from_entrance_to_exit():
+    maze = Maze.generate(15, 10, 'kruskal', seed=3)
+    path = maze.solution()
+    assert path[0] == maze.entrance and path[-1] == maze.exit
+    # Consecutive squares are neighbours
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        assert abs(x1 - x0) + abs(y1 - y0) == 1
@@ -0,0 +1,37 @@
+"""Tests for maze_record. Run with pytest from the python directory."""
+import numpy as np
+import pytest
+
+from maze_model import GENERATORS, SOLVERS
+from maze_record import EventLog, record_run, run_steps
+
+
+@pytest.mark.parametrize('algorithm', sorted(GENERATORS))
+def test_recording_replays_every_step(tmp_path, algorithm):
+    # Steps report the squares they changed, so a missed write would show up as a mismatch
+    expected = [(frame.copy(), cell) for frame, cell, _ in run_steps(algorithm, 9, 7, 1, 'dfs')]
+    path = str(tmp_path / 'run.amzr')
+    grid = record_run(path, algorithm, 9, 7, seed=1, solver='dfs', keyframe_interval=16)
+
+    frames = [(frame.copy(), cell) for frame, cell in EventLog(path).frames()]
+    assert len(frames) >= len(expected)
+    for (frame, cell), (want, want_cell) in zip(frames, expected):
+        assert np.array_equal(frame, want)
+        assert cell == want_cell
+    assert np.array_equal(frames[-1][0], grid)
+
+
+@pytest.mark.parametrize('solver', sorted(SOLVERS))
+def test_recorded_solvers_end_on_the_solved_grid(tmp_path, solver):
+    path = str(tmp_path / 'run.amzr')
+    grid = record_run(path, 'kruskal', 12, 10, seed=2, solver=solver)
+    *_, (frame, _) = EventLog(path).frames()
+    assert np.array_equal(frame, grid)
+    assert (grid == 5).any()
+
+
+def test_bad_seed_leaves_no_file(tmp_path):
+    path = tmp_path / 'run.amzr'
+    with pytest.raises(ValueError):
+        record_run(str(path), 'kruskal', 5, 5, seed=-1)
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,57 @@
+"""Tests for maze_render. Run with pytest from the python directory."""
+import struct
+import zlib
+
+import numpy as np
+
+from maze_io import open_compact, save_maze
+from maze_model import Maze
+from maze_render import ENTRANCE, EXIT, SOLUTION, main, write_png
+
+
+def read_indices(path):
+    """Palette indices of a PNG written by write_png() (4-bit, no filtering)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    offset, idat = 8, b''
+    while offset < len(data):
+        length, kind = struct.unpack_from('>I4s', data, offset)
+        body = data[offset + 8:offset + 8 + length]
+        if kind == b'IHDR':
+            width, height = struct.unpack_from('>II', body)
+        elif kind == b'IDAT':
+            idat += body
+        offset += 12 + length
+    lines = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, -1)[:, 1:]
+    return np.stack((lines >> 4, lines & 15), axis=2).reshape(height, -1)[:, :width]
+
+
+def test_png_matches_the_grid(tmp_path):
+    grid = Maze.generate(9, 6, 'kruskal', seed=1).grid
+    path = str(tmp_path / 'maze.png')
+    assert write_png(path, grid, cell_size=3) == (57, 39)
+    assert np.array_equal(read_indices(path), np.repeat(np.repeat(grid, 3, 0), 3, 1))
+
+
+def test_amz_solution_uses_the_stored_markers(tmp_path):
+    maze = Maze.generate(9, 6, 'kruskal', seed=1)
+    grid = maze.grid
+    # Move the entrance to the left border and the exit to the right border
+    grid[0, 1] = grid[-1, -2] = 1
+    entrance, exit = (0, 5), (18, 9)
+    grid[5, 0], grid[9, 18] = ENTRANCE, EXIT
+    source = str(tmp_path / 'maze.amz')
+    save_maze(source, Maze(grid, entrance=entrance, exit=exit))
+
+    plain, solved = str(tmp_path / 'plain.png'), str(tmp_path / 'solved.png')
+    main([plain, '--input', source, '--cell-size', '1'])
+    main([solved, '--input', source, '--cell-size', '1', '--solution'])
+
+    expected = open_compact(source)[1].to_grid()
+    expected[5, 0], expected[9, 18] = ENTRANCE, EXIT
+    assert np.array_equal(read_indices(plain), expected)
+    pixels = read_indices(solved)
+    assert pixels[5, 0] == pixels[9, 18] == SOLUTION
+    assert pixels[0, 1] == pixels[-1, -2] == 1
+    path = Maze(expected, entrance=entrance, exit=exit).solution()
+    assert (pixels == SOLUTION).sum() == len(path)
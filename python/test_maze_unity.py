@@ -0,0 +1,78 @@
+"""Tests for maze_unity. Run with pytest from the python directory."""
+import struct
+
+import numpy as np
+import pytest
+
+from maze_core import add_maze_entrance_and_exit, carve_passages_kruskal, generate_maze
+from maze_model import GENERATORS, Maze
+from maze_unity import MAGIC, export_unity, path_corners, wall_boxes
+
+
+def read_asset(path):
+    """Return the header fields after the magic, the boxes and the solution corners."""
+    data = path.read_bytes()
+    header = struct.unpack_from('<4sHHHIIHHHH', data)
+    assert header[0] == MAGIC
+    box_count, point_count = header[4], header[5]
+    values = np.frombuffer(data, dtype='<u2', offset=32)
+    boxes = values[:4 * box_count].reshape(-1, 4)
+    corners = values[4 * box_count:4 * box_count + 2 * point_count].reshape(-1, 2)
+    return header[1:], boxes, corners
+
+
+def side_door_maze():
+    """A maze whose entrance is on the west border and exit on the east border."""
+    grid = carve_passages_kruskal(generate_maze(7, 5), 7, 5, rng=2)
+    grid[1, 0] = 2
+    grid[9, 14] = 3
+    return grid
+
+
+def test_markers_are_read_from_the_grid(tmp_path):
+    path = tmp_path / 'maze.bytes'
+    export_unity(str(path), side_door_maze())
+    header, _, corners = read_asset(path)
+    assert header[-4:] == (0, 1, 14, 9)
+    assert tuple(corners[0]) == (0, 1) and tuple(corners[-1]) == (14, 9)
+
+
+def test_passed_markers_survive_solving(tmp_path):
+    grid = side_door_maze()
+    grid[grid >= 2] = 5  # A solve paints over the entrance and exit
+    path = tmp_path / 'maze.bytes'
+    export_unity(str(path), grid, entrance=(0, 1), exit=(14, 9))
+    header, _, corners = read_asset(path)
+    assert header[-4:] == (0, 1, 14, 9)
+    assert tuple(corners[0]) == (0, 1) and tuple(corners[-1]) == (14, 9)
+
+
+def test_markers_default_to_the_usual_positions(tmp_path):
+    grid = carve_passages_kruskal(generate_maze(7, 5), 7, 5, rng=2)
+    add_maze_entrance_and_exit(grid)
+    grid[grid >= 2] = 0
+    path = tmp_path / 'maze.bytes'
+    export_unity(str(path), grid)
+    assert read_asset(path)[0][-4:] == (1, 0, 13, 10)
+
+
+@pytest.mark.parametrize('algorithm', sorted(GENERATORS))
+def test_wall_boxes_cover_each_wall_once(algorithm):
+    for width, height in [(1, 1), (9, 4), (16, 11)]:
+        grid = Maze.generate(width, height, algorithm, seed=3).grid
+        cover = np.zeros(grid.shape, dtype=int)
+        for x0, y0, x1, y1 in wall_boxes(grid).tolist():
+            assert x0 <= x1 and y0 <= y1
+            cover[y0:y1 + 1, x0:x1 + 1] += 1
+        assert np.array_equal(cover, grid == 1)
+
+
+def test_asset_holds_the_boxes_and_solution_corners(tmp_path):
+    maze = Maze.generate(12, 8, 'wilson', seed=6)
+    path = tmp_path / 'maze.bytes'
+    stats = export_unity(str(path), maze.grid, maze.solution(), maze.entrance, maze.exit)
+    header, boxes, corners = read_asset(path)
+    assert header[1:3] == maze.grid.shape[::-1]
+    assert stats == {'boxes': len(boxes), 'solution_points': len(corners)}
+    assert np.array_equal(boxes, wall_boxes(maze.grid))
+    assert [tuple(corner) for corner in corners.tolist()] == path_corners(maze.solution())
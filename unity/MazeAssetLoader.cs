@@ -0,0 +1,204 @@
+using UnityEngine;
+using UnityEngine.Rendering;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+
+// Builds a maze exported by python/maze_unity.py. Walls arrive as merged boxes, which are
+// combined into a few large meshes (one draw call and one collider each) instead of one
+// GameObject per grid square.
+public class MazeAssetLoader : MonoBehaviour
+{
+    public TextAsset mazeAsset; // Exported maze, saved with the .bytes extension
+    public Material wallMaterial; // Material for walls
+    public Material pathMaterial; // Material for the floor
+    public Material solutionMaterial; // Material for the solution line
+    public float cellSize = 1f; // Size of one grid square
+    public float wallHeight = 1f; // Height of the wall boxes
+    public int boxesPerMesh = 8192; // Wall boxes combined into each mesh
+    public bool showSolution = true; // Draw the solution path
+
+    private readonly List<GameObject> spawned = new List<GameObject>(); // Objects created for the current maze
+
+    void Start()
+    {
+        if (mazeAsset != null)
+        {
+            LoadMaze(mazeAsset.bytes);
+        }
+    }
+
+    public void LoadMaze(byte[] data)
+    {
+        Clear();
+
+        using (BinaryReader reader = new BinaryReader(new MemoryStream(data)))
+        {
+            if (Encoding.ASCII.GetString(reader.ReadBytes(4)) != "AMZU")
+            {
+                Debug.LogError("Not a maze asset!");
+                return;
+            }
+            int version = reader.ReadUInt16();
+            if (version > 1)
+            {
+                Debug.LogError("Maze asset version " + version + " is newer than this loader.");
+                return;
+            }
+
+            int cols = reader.ReadUInt16();
+            int rows = reader.ReadUInt16();
+            int boxCount = (int)reader.ReadUInt32();
+            int pointCount = (int)reader.ReadUInt32();
+            Vector2Int entrance = new Vector2Int(reader.ReadUInt16(), reader.ReadUInt16());
+            Vector2Int exit = new Vector2Int(reader.ReadUInt16(), reader.ReadUInt16());
+            reader.ReadBytes(6); // Header padding
+
+            // Grid squares are centred on (x, y) * cellSize, with the maze centred on this object
+            Vector3 boardOffset = new Vector3((cols - 1) * cellSize * 0.5f, 0, (rows - 1) * cellSize * 0.5f);
+
+            CreateFloor(cols, rows);
+            CreateMarker("Maze Entrance", entrance, boardOffset, Color.green);
+            CreateMarker("Maze Exit", exit, boardOffset, Color.red);
+
+            int meshCount = 0;
+            for (int first = 0; first < boxCount; first += boxesPerMesh)
+            {
+                int count = Mathf.Min(boxesPerMesh, boxCount - first);
+                CreateWallMesh(reader, count, boardOffset);
+                meshCount++;
+            }
+
+            Vector3[] solution = new Vector3[pointCount];
+            for (int i = 0; i < pointCount; i++)
+            {
+                solution[i] = GridToLocal(reader.ReadUInt16(), reader.ReadUInt16(), boardOffset) + Vector3.up * 0.02f;
+            }
+            if (showSolution && pointCount > 1)
+            {
+                CreateSolutionLine(solution);
+            }
+
+            Debug.Log("Loaded a " + cols + "x" + rows + " maze: " + boxCount + " wall boxes in " + meshCount + " meshes.");
+        }
+    }
+
+    public void Clear()
+    {
+        foreach (GameObject obj in spawned)
+        {
+            if (obj != null)
+            {
+                Destroy(obj);
+            }
+        }
+        spawned.Clear();
+    }
+
+    Vector3 GridToLocal(int x, int y, Vector3 boardOffset)
+    {
+        return new Vector3(x * cellSize, 0, y * cellSize) - boardOffset;
+    }
+
+    GameObject Spawn(string name)
+    {
+        GameObject obj = new GameObject(name);
+        obj.transform.SetParent(transform, false);
+        spawned.Add(obj);
+        return obj;
+    }
+
+    void CreateFloor(int cols, int rows)
+    {
+        GameObject floor = GameObject.CreatePrimitive(PrimitiveType.Quad);
+        floor.name = "Maze Floor";
+        floor.transform.SetParent(transform, false);
+        floor.transform.localRotation = Quaternion.Euler(90f, 0, 0);
+        floor.transform.localScale = new Vector3(cols * cellSize, rows * cellSize, 1f);
+        floor.GetComponent<Renderer>().sharedMaterial = pathMaterial;
+        spawned.Add(floor);
+    }
+
+    void CreateMarker(string name, Vector2Int square, Vector3 boardOffset, Color color)
+    {
+        GameObject marker = GameObject.CreatePrimitive(PrimitiveType.Quad);
+        marker.name = name;
+        marker.transform.SetParent(transform, false);
+        marker.transform.localPosition = GridToLocal(square.x, square.y, boardOffset) + Vector3.up * 0.01f;
+        marker.transform.localRotation = Quaternion.Euler(90f, 0, 0);
+        marker.transform.localScale = new Vector3(cellSize, cellSize, 1f);
+        Destroy(marker.GetComponent<Collider>());
+        Renderer renderer = marker.GetComponent<Renderer>();
+        renderer.material = new Material(pathMaterial);
+        renderer.material.color = color;
+        spawned.Add(marker);
+    }
+
+    // Read `count` boxes and combine them into one mesh; each box gets its top and four
+    // sides (the bottom is never seen), with four vertices per face for flat normals
+    void CreateWallMesh(BinaryReader reader, int count, Vector3 boardOffset)
+    {
+        Vector3[] vertices = new Vector3[count * 20];
+        int[] triangles = new int[count * 30];
+        float half = cellSize * 0.5f;
+
+        for (int i = 0; i < count; i++)
+        {
+            int x0 = reader.ReadUInt16(), y0 = reader.ReadUInt16(), x1 = reader.ReadUInt16(), y1 = reader.ReadUInt16();
+            Vector3 min = GridToLocal(x0, y0, boardOffset) - new Vector3(half, 0, half);
+            Vector3 max = GridToLocal(x1, y1, boardOffset) + new Vector3(half, wallHeight, half);
+
+            Vector3[] corners =
+            {
+                new Vector3(min.x, min.y, min.z), new Vector3(max.x, min.y, min.z),
+                new Vector3(max.x, min.y, max.z), new Vector3(min.x, min.y, max.z),
+                new Vector3(min.x, max.y, min.z), new Vector3(max.x, max.y, min.z),
+                new Vector3(max.x, max.y, max.z), new Vector3(min.x, max.y, max.z),
+            };
+            int[,] faces =
+            {
+                { 4, 7, 6, 5 }, // Top
+                { 0, 4, 5, 1 }, // South (-z)
+                { 2, 6, 7, 3 }, // North (+z)
+                { 3, 7, 4, 0 }, // West (-x)
+                { 1, 5, 6, 2 }, // East (+x)
+            };
+
+            for (int f = 0; f < 5; f++)
+            {
+                int v = i * 20 + f * 4;
+                for (int c = 0; c < 4; c++)
+                {
+                    vertices[v + c] = corners[faces[f, c]];
+                }
+                int t = i * 30 + f * 6;
+                triangles[t] = v; triangles[t + 1] = v + 1; triangles[t + 2] = v + 2;
+                triangles[t + 3] = v; triangles[t + 4] = v + 2; triangles[t + 5] = v + 3;
+            }
+        }
+
+        Mesh mesh = new Mesh();
+        mesh.indexFormat = vertices.Length > 65535 ? IndexFormat.UInt32 : IndexFormat.UInt16;
+        mesh.vertices = vertices;
+        mesh.triangles = triangles;
+        mesh.RecalculateNormals();
+        mesh.RecalculateBounds();
+
+        GameObject walls = Spawn("Maze Walls");
+        walls.AddComponent<MeshFilter>().sharedMesh = mesh;
+        walls.AddComponent<MeshRenderer>().sharedMaterial = wallMaterial;
+        walls.AddComponent<MeshCollider>().sharedMesh = mesh;
+        walls.isStatic = true;
+    }
+
+    void CreateSolutionLine(Vector3[] points)
+    {
+        GameObject solution = Spawn("Maze Solution");
+        LineRenderer line = solution.AddComponent<LineRenderer>();
+        line.useWorldSpace = false;
+        line.positionCount = points.Length;
+        line.SetPositions(points);
+        line.widthMultiplier = cellSize * 0.3f;
+        line.sharedMaterial = solutionMaterial;
+    }
+}